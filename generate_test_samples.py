@@ -4,14 +4,29 @@ Creates various test PDFs with different characteristics
 """
 
 import fitz  # PyMuPDF
+import numpy as np
 from PIL import Image, ImageDraw
 from pathlib import Path
-import os
+import concurrent.futures
+import io
+import stat
 
 # Create test_samples directory
 SAMPLES_DIR = Path("test_samples")
 SAMPLES_DIR.mkdir(exist_ok=True)
 
+def _canvas(width, height, color):
+    """Allocate a solid RGB canvas as a NumPy array"""
+    return np.full((height, width, 3), color, dtype=np.uint8)
+
+def _ellipse_distance(width, height, bbox):
+    """Normalized elliptical distance grid for a PIL-style bounding box (<= 1 is inside)"""
+    x0, y0, x1, y1 = bbox
+    cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+    rx, ry = (x1 - x0) / 2, (y1 - y0) / 2
+    yy, xx = np.ogrid[:height, :width]
+    return ((xx - cx) / rx) ** 2 + ((yy - cy) / ry) ** 2
+
 def create_text_pdf(filename, pages=5, lines_per_page=30):
     """Create a text-only PDF"""
     print(f"Creating {filename}...")
@@ -26,36 +41,41 @@ def create_text_pdf(filename, pages=5, lines_per_page=30):
         page.insert_text((100, 100), f"Page {page_num + 1} of {pages}", 
                         fontsize=14, fontname="helv")
         
-        # Content lines
-        y = 150
-        for i in range(lines_per_page):
-            text = f"Line {i+1}: This is sample text for testing PDF manipulation features."
-            page.insert_text((100, y), text, fontsize=10, fontname="helv")
-            y += 15
-            if y > 800:
-                break
-    
-    doc.save(str(filepath))
+        # Content lines as one text object per page. insert_textbox writes
+        # nothing and returns a negative value if the text doesn't fit (~44 lines)
+        body = "\n".join(
+            f"Line {i+1}: This is sample text for testing PDF manipulation features."
+            for i in range(lines_per_page)
+        )
+        spare = page.insert_textbox(fitz.Rect(100, 140, 545, 805), body,
+                                    fontsize=10, fontname="helv", lineheight=1.5)
+        if spare < 0:
+            raise ValueError(f"{lines_per_page} lines don't fit on one page of {filename}")
+    
+    doc.save(str(filepath), garbage=4, deflate=True, deflate_images=True,
+             deflate_fonts=True, clean=True)
     doc.close()
     
-    size = os.path.getsize(filepath)
+    size = filepath.stat().st_size
     print(f"  ✓ Created {filename} ({size / 1024:.1f} KB, {pages} pages)")
 
 def create_image_pdf(filename, pages=3):
     """Create a PDF with embedded images"""
     print(f"Creating {filename}...")
     
-    # Create temporary images
-    temp_images = []
+    # Encode images in memory so MuPDF can embed the compressed stream as-is
+    image_streams = []
     for i in range(2):
-        img = Image.new('RGB', (400, 300), color=(100 + i*50, 150, 200 - i*30))
+        arr = _canvas(400, 300, (100 + i*50, 150, 200 - i*30))
+        arr[50:251, 50:351] = (255, 255, 255)  # Outline (width 3)
+        arr[53:248, 53:348] = (100 + i*50, 150, 200 - i*30)
+        img = Image.fromarray(arr)
         draw = ImageDraw.Draw(img)
-        draw.rectangle([50, 50, 350, 250], outline=(255, 255, 255), width=3)
         draw.text((150, 130), f"Image {i+1}", fill=(255, 255, 255))
         
-        img_path = SAMPLES_DIR / f"temp_img_{i}.jpg"
-        img.save(img_path, 'JPEG', quality=85)
-        temp_images.append(img_path)
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=85, optimize=True, progressive=True, subsampling=2)
+        image_streams.append((buffer.getvalue(), img.width, img.height))
     
     # Create PDF
     filepath = SAMPLES_DIR / filename
@@ -67,19 +87,17 @@ def create_image_pdf(filename, pages=3):
                         fontsize=14, fontname="helvb")
         
         y_pos = 150
-        for img_path in temp_images:
+        for data, width, height in image_streams:
             page.insert_image(fitz.Rect(100, y_pos, 400, y_pos + 200), 
-                            filename=str(img_path))
+                            stream=data, width=width, height=height, alpha=0)
             y_pos += 250
     
-    doc.save(str(filepath))
+    # Images are already JPEG-compressed, so only deflate the page/font streams
+    doc.save(str(filepath), garbage=4, deflate=True, deflate_images=False,
+             deflate_fonts=True, clean=True)
     doc.close()
     
-    # Clean up temp images
-    for img_path in temp_images:
-        img_path.unlink()
-    
-    size = os.path.getsize(filepath)
+    size = filepath.stat().st_size
     print(f"  ✓ Created {filename} ({size / 1024:.1f} KB, {pages} pages)")
 
 def create_blank_pages_pdf(filename):
@@ -107,10 +125,11 @@ def create_blank_pages_pdf(filename):
     page = doc.new_page()
     page.insert_text((100, 100), "Page 5: Final content page", fontsize=12)
     
-    doc.save(str(filepath))
+    doc.save(str(filepath), garbage=4, deflate=True, deflate_images=True,
+             deflate_fonts=True, clean=True)
     doc.close()
     
-    size = os.path.getsize(filepath)
+    size = filepath.stat().st_size
     print(f"  ✓ Created {filename} ({size / 1024:.1f} KB, 5 pages with 2 blanks)")
 
 def create_test_images():
@@ -118,31 +137,39 @@ def create_test_images():
     print("Creating test images...")
     
     # Large image
-    img_large = Image.new('RGB', (1600, 1600), color=(120, 160, 200))
+    arr = _canvas(1600, 1600, (120, 160, 200))
+    arr[_ellipse_distance(1600, 1600, (400, 400, 1200, 1200)) <= 1] = (200, 150, 150)
+    img_large = Image.fromarray(arr)
     draw = ImageDraw.Draw(img_large)
-    draw.ellipse([400, 400, 1200, 1200], fill=(200, 150, 150))
     draw.text((680, 760), "LARGE", fill=(255, 255, 255))
     large_path = SAMPLES_DIR / "large_image.jpg"
-    img_large.save(large_path, 'JPEG', quality=95)
-    print(f"  ✓ large_image.jpg ({os.path.getsize(large_path) / 1024:.1f} KB)")
+    img_large.save(large_path, 'JPEG', quality=85, optimize=True, progressive=True)
+    print(f"  ✓ large_image.jpg ({large_path.stat().st_size / 1024:.1f} KB)")
     
     #Photo for passport test
-    img_photo = Image.new('RGB', (1200, 1200), color=(220, 200, 180))
-    draw = ImageDraw.Draw(img_photo)
-    draw.ellipse([200, 200, 1000, 1000], fill=(255, 220, 200), outline=(100, 100, 100), width=5)
-    draw.rectangle([500, 450, 700, 550], fill=(80, 80, 80))  # Eyes
-    draw.arc([400, 600, 800, 750], 0, 180, fill=(100, 100, 100), width=3)  # Smile
+    arr = _canvas(1200, 1200, (220, 200, 180))
+    face = _ellipse_distance(1200, 1200, (200, 200, 1000, 1000))
+    arr[face <= 1] = (100, 100, 100)  # Outline (width 5)
+    arr[_ellipse_distance(1200, 1200, (205, 205, 995, 995)) <= 1] = (255, 220, 200)
+    arr[450:551, 500:701] = (80, 80, 80)  # Eyes
+    smile = (_ellipse_distance(1200, 1200, (400, 600, 800, 750)) <= 1) & \
+            (_ellipse_distance(1200, 1200, (403, 603, 797, 747)) > 1)
+    smile[:675] = False  # Lower half only (0-180 degrees)
+    arr[smile] = (100, 100, 100)  # Smile
+    img_photo = Image.fromarray(arr)
     photo_path = SAMPLES_DIR / "photo_test.jpg"
-    img_photo.save(photo_path, 'JPEG', quality=90)
-    print(f"  ✓ photo_test.jpg ({os.path.getsize(photo_path) / 1024:.1f} KB)")
+    img_photo.save(photo_path, 'JPEG', quality=90, optimize=True, progressive=True)
+    print(f"  ✓ photo_test.jpg ({photo_path.stat().st_size / 1024:.1f} KB)")
     
-    # Small images for img2pdf
+    # Small images for img2pdf (one shared canvas, refilled per page)
+    base = np.empty((400, 600, 3), dtype=np.uint8)
     for i in range(3):
-        img = Image.new('RGB', (600, 400), color=(80 + i*50, 120 + i*30, 180 - i*40))
+        base[:] = (80 + i*50, 120 + i*30, 180 - i*40)
+        img = Image.fromarray(base)
         draw = ImageDraw.Draw(img)
         draw.text((250, 180), f"Page {i+1}", fill=(255, 255, 255))
         img_path = SAMPLES_DIR / f"page_{i+1}.jpg"
-        img.save(img_path, 'JPEG', quality=85)
+        img.save(img_path, 'JPEG', quality=85, optimize=True, progressive=True)
     print(f"  ✓ page_1.jpg, page_2.jpg, page_3.jpg")
 
 def main():
@@ -151,20 +178,27 @@ def main():
     print("="*70)
     print()
     
-    # Text PDFs of various sizes
-    create_text_pdf("small_text.pdf", pages=3, lines_per_page=15)
-    create_text_pdf("medium_text.pdf", pages=10, lines_per_page=30)
-    create_text_pdf("large_text.pdf", pages=30, lines_per_page=40)
-    
-    # Image PDFs
-    create_image_pdf("small_images.pdf", pages=2)
-    create_image_pdf("large_images.pdf", pages=8)
-    
-    # Special test PDF
-    create_blank_pages_pdf("with_blanks.pdf")
-    
-    # Test images
-    create_test_images()
+    # Every sample is an independent file, so build them in parallel
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        futures = [
+            # Text PDFs of various sizes
+            executor.submit(create_text_pdf, "small_text.pdf", pages=3, lines_per_page=15),
+            executor.submit(create_text_pdf, "medium_text.pdf", pages=10, lines_per_page=30),
+            executor.submit(create_text_pdf, "large_text.pdf", pages=30, lines_per_page=40),
+            
+            # Image PDFs
+            executor.submit(create_image_pdf, "small_images.pdf", pages=2),
+            executor.submit(create_image_pdf, "large_images.pdf", pages=8),
+            
+            # Special test PDF
+            executor.submit(create_blank_pages_pdf, "with_blanks.pdf"),
+            
+            # Test images
+            executor.submit(create_test_images),
+        ]
+        
+        for future in futures:
+            future.result()
     
     print()
     print("="*70)
@@ -174,8 +208,9 @@ def main():
     # List all files
     print("\nGenerated files:")
     for file in sorted(SAMPLES_DIR.iterdir()):
-        if file.is_file():
-            size = os.path.getsize(file) / 1024
+        st = file.stat()  # One stat call for both the type check and the size
+        if stat.S_ISREG(st.st_mode):
+            size = st.st_size / 1024
             print(f"  - {file.name:30s} ({size:7.1f} KB)")
 
 if __name__ == "__main__":
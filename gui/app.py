@@ -5,24 +5,37 @@ Modern dark-themed GUI with Windows accent colors
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import importlib
 import sys
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from gui.theme import theme, font, PDFWizardTheme
 
-from gui.theme import theme, PDFWizardTheme
-from gui.panels.merge_panel import MergePanel
-from gui.panels.compress_panel import CompressPanel
-from gui.panels.split_panel import SplitPanel
-from gui.panels.resize_image_panel import ResizeImagePanel
-from gui.panels.qr_panel import QRPanel
-from gui.panels.security_panel import SecurityPanel
-from gui.panels.metadata_panel import MetadataPanel
-from gui.panels.convert_panel import ConvertPanel
-from gui.panels.compress_image_panel import CompressImagePanel
-from gui.panels.page_tools_panel import PageToolsPanel
-from gui.panels.compare_panel import ComparePanel
+# Panel modules are imported on first use - each one pulls in the
+# controller and its PDF/image backends, which dominates cold start
+_PANELS = {
+    "merge": ("gui.panels.merge_panel", "MergePanel"),
+    "split": ("gui.panels.split_panel", "SplitPanel"),
+    "compress": ("gui.panels.compress_panel", "CompressPanel"),
+    "security": ("gui.panels.security_panel", "SecurityPanel"),
+    "metadata": ("gui.panels.metadata_panel", "MetadataPanel"),
+    "resize": ("gui.panels.resize_image_panel", "ResizeImagePanel"),
+    "compress_image": ("gui.panels.compress_image_panel", "CompressImagePanel"),
+    "convert": ("gui.panels.convert_panel", "ConvertPanel"),
+    "page_tools": ("gui.panels.page_tools_panel", "PageToolsPanel"),
+    "qr": ("gui.panels.qr_panel", "QRPanel"),
+    "compare": ("gui.panels.compare_panel", "ComparePanel"),
+}
+_panel_classes = {}
+
+
+def _get_panel_class(panel_name):
+    """Import (once) and return the panel class registered under panel_name"""
+    panel_class = _panel_classes.get(panel_name)
+    if panel_class is None:
+        module_name, class_name = _PANELS[panel_name]
+        panel_class = getattr(importlib.import_module(module_name), class_name)
+        _panel_classes[panel_name] = panel_class
+    return panel_class
 
 # Set appearance mode and default color theme
 ctk.set_appearance_mode("dark")
@@ -45,6 +58,7 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         
         # Configure colors
         self.configure(fg_color=theme.BG_PRIMARY)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Set window icon (if available)
         try:
@@ -52,13 +66,22 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         except:
             pass
         
-        # Current panel reference
+        # Current panel reference and panels built so far (reused on revisit)
         self.current_panel = None
+        self._panel_cache = {}
         
         # Create UI
         self.create_layout()
         self.show_panel("merge")
         
+    def _on_close(self):
+        """Stop background jobs so closing the window exits right away"""
+        # Only loaded once a panel has used it - nothing to stop otherwise
+        worker = sys.modules.get("gui.worker")
+        if worker is not None:
+            worker.shutdown()
+        self.destroy()
+        
     def create_layout(self):
         """Create the main layout with sidebar and content area"""
         
@@ -80,33 +103,37 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         title = ctk.CTkLabel(
             self.sidebar,
             text="🧙 PDF Wizard",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=20, weight="bold"),
+            font=font(20, "bold"),
             text_color=theme.TEXT_PRIMARY
         )
         title.grid(row=0, column=0, padx=20, pady=20)
         
+        # Sidebar fonts, shared by every header/button below
+        header_font = font(12, "bold")
+        nav_font = font(13)
+        
         # PDF Operations section
-        self.create_section_header(self.sidebar, 1, "📄 PDF Operations")
-        self.create_nav_button(self.sidebar, 2, "Merge", "merge")
-        self.create_nav_button(self.sidebar, 3, "Split", "split")
-        self.create_nav_button(self.sidebar, 4, "Compress", "compress")
-        self.create_nav_button(self.sidebar, 5, "Security", "security")
-        self.create_nav_button(self.sidebar, 6, "Metadata", "metadata")
+        self.create_section_header(self.sidebar, 1, "📄 PDF Operations", header_font)
+        self.create_nav_button(self.sidebar, 2, "Merge", "merge", nav_font)
+        self.create_nav_button(self.sidebar, 3, "Split", "split", nav_font)
+        self.create_nav_button(self.sidebar, 4, "Compress", "compress", nav_font)
+        self.create_nav_button(self.sidebar, 5, "Security", "security", nav_font)
+        self.create_nav_button(self.sidebar, 6, "Metadata", "metadata", nav_font)
         
         # Image Processing section
-        self.create_section_header(self.sidebar, 8, "📸 Image Processing")
-        self.create_nav_button(self.sidebar, 9, "Resize", "resize")
-        self.create_nav_button(self.sidebar, 10, "Compress Image", "compress_image")
-        self.create_nav_button(self.sidebar, 11, "Convert", "convert")
+        self.create_section_header(self.sidebar, 8, "📸 Image Processing", header_font)
+        self.create_nav_button(self.sidebar, 9, "Resize", "resize", nav_font)
+        self.create_nav_button(self.sidebar, 10, "Compress Image", "compress_image", nav_font)
+        self.create_nav_button(self.sidebar, 11, "Convert", "convert", nav_font)
         
         # Academic Tools section
-        self.create_section_header(self.sidebar, 13, "🎓 Academic Tools")
-        self.create_nav_button(self.sidebar, 14, "Page Tools", "page_tools")
-        self.create_nav_button(self.sidebar, 15, "QR Generator", "qr")
-        self.create_nav_button(self.sidebar, 16, "Compare", "compare")
+        self.create_section_header(self.sidebar, 13, "🎓 Academic Tools", header_font)
+        self.create_nav_button(self.sidebar, 14, "Page Tools", "page_tools", nav_font)
+        self.create_nav_button(self.sidebar, 15, "QR Generator", "qr", nav_font)
+        self.create_nav_button(self.sidebar, 16, "Compare", "compare", nav_font)
         
         # Settings at bottom
-        self.create_nav_button(self.sidebar, 21, "⚙️ Settings", "settings")
+        self.create_nav_button(self.sidebar, 21, "⚙️ Settings", "settings", nav_font)
         
         # ==== CONTENT AREA ====
         self.content = ctk.CTkFrame(
@@ -118,24 +145,24 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         self.content.grid_columnconfigure(0, weight=1)
         self.content.grid_rowconfigure(0, weight=1)
         
-    def create_section_header(self, parent, row, text):
+    def create_section_header(self, parent, row, text, label_font):
         """Create a section header in the sidebar"""
         label = ctk.CTkLabel(
             parent,
             text=text,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12, weight="bold"),
+            font=label_font,
             text_color=theme.TEXT_SECONDARY,
             anchor="w"
         )
         label.grid(row=row, column=0, padx=20, pady=(15, 5), sticky="w")
         
-    def create_nav_button(self, parent, row, text, panel_name):
+    def create_nav_button(self, parent, row, text, panel_name, button_font):
         """Create a navigation button"""
         btn = ctk.CTkButton(
             parent,
             text=text,
             command=lambda: self.show_panel(panel_name),
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            font=button_font,
             fg_color="transparent",
             text_color=theme.TEXT_PRIMARY,
             hover_color=theme.BG_TERTIARY,
@@ -147,36 +174,21 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         
     def show_panel(self, panel_name):
         """Switch to a different panel"""
-        # Clear current panel
+        # Hide current panel (kept alive so its state survives switching back)
         if self.current_panel:
-            self.current_panel.destroy()
-        
-        # Create new panel
-        if panel_name == "merge":
-            self.current_panel = MergePanel(self.content)
-        elif panel_name == "split":
-            self.current_panel = SplitPanel(self.content)
-        elif panel_name == "compress":
-            self.current_panel = CompressPanel(self.content)
-        elif panel_name == "security":
-            self.current_panel = SecurityPanel(self.content)
-        elif panel_name == "metadata":
-            self.current_panel = MetadataPanel(self.content)
-        elif panel_name == "resize":
-            self.current_panel = ResizeImagePanel(self.content)
-        elif panel_name == "compress_image":
-            self.current_panel = CompressImagePanel(self.content)
-        elif panel_name == "convert":
-            self.current_panel = ConvertPanel(self.content)
-        elif panel_name == "page_tools":
-            self.current_panel = PageToolsPanel(self.content)
-        elif panel_name == "qr":
-            self.current_panel = QRPanel(self.content)
-        elif panel_name == "compare":
-            self.current_panel = ComparePanel(self.content)
-        elif panel_name == "settings":
-            self.current_panel = self.create_placeholder("Settings")
-        
+            self.current_panel.grid_remove()
+        
+        # Build the panel on first visit only
+        panel = self._panel_cache.get(panel_name)
+        if panel is None:
+            if panel_name in _PANELS:
+                panel = _get_panel_class(panel_name)(self.content)
+            else:
+                # Sections without a panel yet (e.g. settings)
+                panel = self.create_placeholder(panel_name.title())
+            self._panel_cache[panel_name] = panel
+        
+        self.current_panel = panel
         self.current_panel.grid(row=0, column=0, sticky="nsew", padx=0, pady=0)
         
     def create_placeholder(self, title):
@@ -186,7 +198,7 @@ class PDFWizardGUI(ctk.CTk, TkinterDnD.DnDWrapper):
         label = ctk.CTkLabel(
             frame,
             text=f"{title}\n\n(Coming soon...)",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=24),
+            font=font(24),
             text_color=theme.TEXT_SECONDARY
         )
         label.pack(expand=True)
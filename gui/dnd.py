@@ -1,25 +1,59 @@
 
 import re
 
+# Matches a path wrapped in {} (paths with spaces) or a plain whitespace-free path
+_DROP_RE = re.compile(r'\{([^}]+)\}|(\S+)')
+
+# Lower-cased extensions the panels accept, checked against os.path.splitext
+PDF_EXTS = frozenset({'.pdf'})
+IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png'})
+
+# Drops arriving within this window are coalesced and only the last is handled
+DROP_COALESCE_MS = 30
+
+
 def parse_dropped_files(data):
     """Parse TkinterDnD dropped file list
-    
+
     Handles paths with spaces (wrapped in {}) and simple space-separated paths.
     """
-    files = []
     if not data:
-        return files
-        
-    # Check if data contains curly braces (indicated paths with spaces)
-    if '{' in data:
-         # Regex to match content inside {} or single words
-         pattern = r'\{(.+?)\}|([^ ]+)'
-         for match in re.finditer(pattern, data):
-             path = match.group(1) or match.group(2)
-             if path:
-                 files.append(path)
-    else:
-         # simple space separated (if no spaces in paths)
-         files = data.split()
-         
-    return files
+        return []
+
+    return [match.group(1) or match.group(2) for match in _DROP_RE.finditer(data)]
+
+
+def parse_first_dropped_file(data):
+    """Return only the first path of a TkinterDnD drop, or None
+
+    Same rules as parse_dropped_files, but stops at the first match instead
+    of building the whole list - for panels that take a single file.
+    """
+    if not data:
+        return None
+
+    match = _DROP_RE.search(data)
+    return (match.group(1) or match.group(2)) if match else None
+
+
+class DropCoalescer:
+    """<<Drop>> callback that hands only the last drop of a burst to handler
+
+    One drag gesture can fire several drop events; the handler runs once,
+    DROP_COALESCE_MS after the first, with the most recent event's data.
+    """
+
+    def __init__(self, widget, handler):
+        self._widget = widget
+        self._handler = handler
+        self._pending = None
+        self._after_id = None
+
+    def __call__(self, event):
+        self._pending = event.data
+        if self._after_id is None:
+            self._after_id = self._widget.after(DROP_COALESCE_MS, self._fire)
+
+    def _fire(self):
+        data, self._pending, self._after_id = self._pending, None, None
+        self._handler(data)
@@ -0,0 +1,57 @@
+"""
+Base Panel - Shared scaffold for the tool panels
+
+Builds the header, section frames and status label that every panel repeats.
+"""
+
+import customtkinter as ctk
+
+from gui.theme import theme, font
+
+
+class BasePanel(ctk.CTkFrame):
+    """Grid-based panel with helpers for the standard widgets"""
+    
+    def __init__(self, parent):
+        super().__init__(parent, fg_color=theme.BG_PRIMARY, corner_radius=0)
+        self.grid_columnconfigure(0, weight=1)
+        self._pending_status = None
+        self._status_job = None
+        
+    def _make_header(self, title, subtitle):
+        """Add the title (row 0) and subtitle (row 1)"""
+        ctk.CTkLabel(
+            self, text=title, font=font(28, "bold"),
+            text_color=theme.TEXT_PRIMARY, anchor="w"
+        ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
+        
+        ctk.CTkLabel(
+            self, text=subtitle, font=font(14),
+            text_color=theme.TEXT_SECONDARY, anchor="w"
+        ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
+        
+    def _section_frame(self, row, sticky="ew"):
+        """Add a rounded section frame on the given row and return it"""
+        frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
+        frame.grid(row=row, column=0, sticky=sticky, padx=30, pady=(0, 15))
+        return frame
+        
+    def _make_status(self, row, text):
+        """Add the status label as self.status_label"""
+        self.status_label = ctk.CTkLabel(
+            self, text=text, font=font(12),
+            text_color=theme.TEXT_SECONDARY
+        )
+        self.status_label.grid(row=row, column=0, sticky="ew", padx=30, pady=(0, 15))
+        
+    def update_status(self, message, color=None):
+        """Update the status label (bursts are coalesced into one redraw)"""
+        self._pending_status = (message, color or theme.TEXT_SECONDARY)
+        if not self._status_job:
+            self._status_job = self.after_idle(self._flush_status)
+        
+    def _flush_status(self):
+        """Apply the latest pending status"""
+        self._status_job = None
+        message, color = self._pending_status
+        self.status_label.configure(text=message, text_color=color)
@@ -5,13 +5,20 @@ Compare Panel - Compare two PDFs and highlight differences
 import customtkinter as ctk
 from pathlib import Path
 from tkinter import filedialog, messagebox
-import threading
+import os
+import time
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, parse_first_dropped_file
+from gui.worker import EXECUTOR
+
+
+# Duplicate drop events arriving closer together than this are ignored
+DROP_DEBOUNCE_SECONDS = 0.1
+
 
 class ComparePanel(ctk.CTkFrame):
     """Panel for comparing PDFs"""
@@ -26,6 +33,10 @@ class ComparePanel(ctk.CTkFrame):
         self.file2 = ""
         self.output_file = ""
         
+        # Last drop seen, to ignore duplicate <<Drop>> events fired by the OS
+        self._last_drop = None
+        self._last_drop_time = 0.0
+        
         self.create_widgets()
         
         # Enable Drag & Drop
@@ -43,10 +54,18 @@ class ComparePanel(ctk.CTkFrame):
         
     def _handle_drop(self, event, num):
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            # Skip repeats of the same drop within the debounce window
+            now = time.monotonic()
+            drop = (event.data, num)
+            if drop == self._last_drop and now - self._last_drop_time < DROP_DEBOUNCE_SECONDS:
+                return
+            self._last_drop, self._last_drop_time = drop, now
+            
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if file == (self.file1 if num == 1 else self.file2):
+                    return  # Already selected
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     if num == 1:
                         self.file1 = file
                         self.pdf1_entry.delete(0, "end")
@@ -63,13 +82,13 @@ class ComparePanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="Compare PDFs", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="Compare PDFs", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Compare two PDF files and identify differences",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # PDF 1
@@ -77,7 +96,7 @@ class ComparePanel(ctk.CTkFrame):
         pdf1_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            pdf1_frame, text="First PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            pdf1_frame, text="First PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -86,14 +105,14 @@ class ComparePanel(ctk.CTkFrame):
         
         self.pdf1_entry = ctk.CTkEntry(
             path1_frame, placeholder_text="Choose first PDF...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.pdf1_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path1_frame, text="📁", command=self.browse_pdf1,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -103,7 +122,7 @@ class ComparePanel(ctk.CTkFrame):
         pdf2_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            pdf2_frame, text="Second PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            pdf2_frame, text="Second PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -112,14 +131,14 @@ class ComparePanel(ctk.CTkFrame):
         
         self.pdf2_entry = ctk.CTkEntry(
             path2_frame, placeholder_text="Choose second PDF...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.pdf2_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path2_frame, text="📁", command=self.browse_pdf2,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -129,7 +148,7 @@ class ComparePanel(ctk.CTkFrame):
         output_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Comparison Report", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Comparison Report", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -138,14 +157,14 @@ class ComparePanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Save comparison report as...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -153,7 +172,7 @@ class ComparePanel(ctk.CTkFrame):
         # Compare button
         self.compare_btn = ctk.CTkButton(
             self, text="🔍 COMPARE PDFS", command=self.compare_pdfs,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
@@ -161,7 +180,7 @@ class ComparePanel(ctk.CTkFrame):
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select two PDFs to compare", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select two PDFs to compare", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 15))
@@ -169,14 +188,14 @@ class ComparePanel(ctk.CTkFrame):
     def browse_pdf1(self):
         file = filedialog.askopenfilename(title="Select first PDF", filetypes=[("PDF files", "*.pdf")])
         if file:
-            self.pdf1 = file
+            self.file1 = file
             self.pdf1_entry.delete(0, "end")
             self.pdf1_entry.insert(0, file)
             
     def browse_pdf2(self):
         file = filedialog.askopenfilename(title="Select second PDF", filetypes=[("PDF files", "*.pdf")])
         if file:
-            self.pdf2 = file
+            self.file2 = file
             self.pdf2_entry.delete(0, "end")
             self.pdf2_entry.insert(0, file)
             
@@ -192,7 +211,7 @@ class ComparePanel(ctk.CTkFrame):
             self.output_entry.insert(0, file)
             
     def compare_pdfs(self):
-        if not self.pdf1 or not self.pdf2:
+        if not self.file1 or not self.file2:
             messagebox.showerror("Error", "Please select both PDF files")
             return
             
@@ -202,11 +221,11 @@ class ComparePanel(ctk.CTkFrame):
         self.compare_btn.configure(state="disabled", text="Comparing...")
         self.status_label.configure(text="Comparing PDFs...", text_color=theme.INFO)
         
-        threading.Thread(target=self._do_compare).start()
+        EXECUTOR.submit(self._do_compare)
         
     def _do_compare(self):
         try:
-            success = Controller.compare_pdfs(self.pdf1, self.pdf2, self.output_file)
+            success = Controller.compare_pdfs(self.file1, self.file2, self.output_file)
             self.after(0, self._complete, success)
         except Exception as e:
             self.after(0, self._error, str(e))
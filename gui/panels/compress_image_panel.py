@@ -3,25 +3,31 @@ Compress Image Panel - Compress images to target file size
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
+import queue
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
-from pdf_wizard.controller import Controller
+from gui.theme import theme, font
 
 
-from gui.dnd import parse_dropped_files
+from gui import toast
+from gui.dnd import IMG_EXTS, parse_first_dropped_file
+from gui.panels.base_panel import BasePanel
+from gui.worker import EXECUTOR
 
-class CompressImagePanel(ctk.CTkFrame):
+
+class CompressImagePanel(BasePanel):
     """Panel for compressing images"""
     
     def __init__(self, parent):
-        super().__init__(parent, fg_color=theme.BG_PRIMARY, corner_radius=0)
+        super().__init__(parent)
         
-        self.grid_columnconfigure(0, weight=1)
         self.input_file = ""
         self.output_file = ""
+        self._last_dir = None  # Start dialogs where the user last picked a file
+        self._quality = 85  # Last whole-number slider value
+        self._quality_job = None
+        self._progress_q = None  # Probe progress from the running job, drained on the Tk thread
         
         self.create_widgets()
         
@@ -32,36 +38,37 @@ class CompressImagePanel(ctk.CTkFrame):
     def drop_file(self, event):
         """Handle file drop event"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith(('.jpg', '.jpeg', '.png')):
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if os.path.splitext(file)[1].lower() in IMG_EXTS:
                     self.input_file = file
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
                     
                     # Auto-set output (logic copied from current impl)
                     if not self.output_file:
-                        p = Path(file)
-                        output = str(p.with_name(f"{p.stem}_compressed{p.suffix}"))
+                        root, ext = os.path.splitext(file)
+                        output = f"{root}_compressed{ext}"
                         self.output_entry.delete(0, "end")
                         self.output_entry.insert(0, output)
                         self.output_file = output
                 else:
-                    self.status_label.configure(text="Please drop an image file", text_color=theme.WARNING)
+                    self.update_status("Please drop an image file", theme.WARNING)
         except Exception as e:
             print(f"Drop error: {e}")
         
     def create_widgets(self):
+        accent, accent_hover = theme.get_accent(), theme.get_accent_hover()
+        
         # Header
         ctk.CTkLabel(
-            self, text="Compress Image", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="Compress Image", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Reduce image file size while maintaining quality",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Input
@@ -69,7 +76,7 @@ class CompressImagePanel(ctk.CTkFrame):
         input_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Input Image", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input Image", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -78,14 +85,14 @@ class CompressImagePanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose image file...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -95,7 +102,7 @@ class CompressImagePanel(ctk.CTkFrame):
         settings_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            settings_frame, text="Compression Settings", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            settings_frame, text="Compression Settings", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -104,20 +111,20 @@ class CompressImagePanel(ctk.CTkFrame):
         size_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         ctk.CTkLabel(
-            size_frame, text="Target Size:", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            size_frame, text="Target Size:", font=font(13),
             text_color=theme.TEXT_PRIMARY, width=120, anchor="w"
         ).pack(side="left")
         
         self.size_entry = ctk.CTkEntry(
             size_frame, placeholder_text="100", width=100,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=32, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.size_entry.pack(side="left")
         self.size_entry.insert(0, "100")
         
         ctk.CTkLabel(
-            size_frame, text=" KB", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=11),
+            size_frame, text=" KB", font=font(11),
             text_color=theme.TEXT_SECONDARY
         ).pack(side="left", padx=10)
         
@@ -126,19 +133,19 @@ class CompressImagePanel(ctk.CTkFrame):
         quality_frame.pack(fill="x", padx=20, pady=(0, 15))
         
         ctk.CTkLabel(
-            quality_frame, text="Quality:", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            quality_frame, text="Quality:", font=font(13),
             text_color=theme.TEXT_PRIMARY, width=120, anchor="w"
         ).pack(side="left")
         
         self.quality_slider = ctk.CTkSlider(
             quality_frame, from_=1, to=100, number_of_steps=99,
-            fg_color=theme.BG_TERTIARY, progress_color=theme.get_accent()
+            fg_color=theme.BG_TERTIARY, progress_color=accent
         )
         self.quality_slider.pack(side="left", fill="x", expand=True, padx=(0, 10))
         self.quality_slider.set(85)
         
         self.quality_label = ctk.CTkLabel(
-            quality_frame, text="85%", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            quality_frame, text="85%", font=font(12),
             text_color=theme.TEXT_PRIMARY, width=40
         )
         self.quality_label.pack(side="left")
@@ -150,7 +157,7 @@ class CompressImagePanel(ctk.CTkFrame):
         output_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Output File", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output File", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -159,14 +166,14 @@ class CompressImagePanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -174,45 +181,68 @@ class CompressImagePanel(ctk.CTkFrame):
         # Compress button
         self.compress_btn = ctk.CTkButton(
             self, text="🗜️ COMPRESS IMAGE", command=self.compress_image,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
-            fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
+            font=font(15, "bold"), height=45,
+            fg_color=accent, hover_color=accent_hover,
             corner_radius=10
         )
         self.compress_btn.grid(row=5, column=0, sticky="ew", padx=30, pady=(0, 10))
         
+        # Progress
+        self.progress_bar = ctk.CTkProgressBar(
+            self, height=6, fg_color=theme.BG_TERTIARY, progress_color=accent
+        )
+        self.progress_bar.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 10))
+        self.progress_bar.set(0)
+        
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select an image to compress", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select an image to compress", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
-        self.status_label.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 15))
+        self.status_label.grid(row=7, column=0, sticky="ew", padx=30, pady=(0, 15))
         
     def update_quality_label(self, value):
-        self.quality_label.configure(text=f"{int(value)}%")
+        quality = int(value)
+        if quality == self._quality:
+            return
+        self._quality = quality
+        # Coalesce slider drags into at most one label redraw per frame (~60 Hz)
+        if self._quality_job:
+            self.after_cancel(self._quality_job)
+        self._quality_job = self.after(16, self._apply_quality_label)
+        
+    def _apply_quality_label(self):
+        self._quality_job = None
+        self.quality_label.configure(text=f"{self._quality}%")
         
     def browse_input(self):
+        self.update_idletasks()
         file = filedialog.askopenfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Select image", filetypes=[("Image files", "*.jpg *.jpeg *.png"), ("All files", "*.*")]
         )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.input_file = file
             self.input_entry.delete(0, "end")
             self.input_entry.insert(0, file)
             
             if not self.output_file:
-                # Python 3.8 compatible replacement for with_stem
-                p = Path(file)
-                output = str(p.with_name(f"{p.stem}_compressed{p.suffix}"))
+                root, ext = os.path.splitext(file)
+                output = f"{root}_compressed{ext}"
                 self.output_entry.delete(0, "end")
                 self.output_entry.insert(0, output)
                 self.output_file = output
             
     def browse_output(self):
+        self.update_idletasks()
         file = filedialog.asksaveasfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Save compressed image as", defaultextension=".jpg",
             filetypes=[("JPEG", "*.jpg"), ("PNG", "*.png")]
         )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.output_file = file
             self.output_entry.delete(0, "end")
             self.output_entry.insert(0, file)
@@ -222,35 +252,63 @@ class CompressImagePanel(ctk.CTkFrame):
             messagebox.showerror("Error", "Please select input and output files")
             return
             
+        if not os.path.isfile(self.input_file):
+            messagebox.showerror("Error", f"Input file not found:\n{self.input_file}")
+            return
+            
         target_kb = self.size_entry.get().strip()
         if not target_kb:
             messagebox.showerror("Error", "Please enter target size")
             return
             
         self.compress_btn.configure(state="disabled", text="Compressing...")
-        self.status_label.configure(text="Compressing image...", text_color=theme.INFO)
+        self.update_status("Compressing image...", theme.INFO)
         
-        quality = int(self.quality_slider.get())
-        threading.Thread(target=self._do_compress, args=(int(target_kb), quality)).start()
+        # Fresh queue per job so late updates from a previous run are never shown
+        self._progress_q = queue.Queue()
+        self.progress_bar.set(0)
+        self.after(50, self._drain_progress, self._progress_q)
         
-    def _do_compress(self, target_kb, quality):
+        EXECUTOR.submit(self._do_compress, int(target_kb), self._quality, self._progress_q)
+        
+    def _do_compress(self, target_kb, quality, progress_q):
+        # Imported here so Pillow/PyMuPDF load on the worker thread, not at GUI startup
+        from pdf_wizard.controller import Controller
         try:
             success = Controller.compress_image(
-                self.input_file, self.output_file, target_kb, quality
+                self.input_file, self.output_file, target_kb, quality,
+                on_progress=progress_q.put
             )
             self.after(0, self._complete, success)
         except Exception as e:
             self.after(0, self._error, str(e))
             
+    def _drain_progress(self, progress_q):
+        # Only the newest value matters - skip anything queued in between polls
+        fraction = None
+        while True:
+            try:
+                fraction = progress_q.get_nowait()
+            except queue.Empty:
+                break
+        if fraction is not None:
+            self.progress_bar.set(fraction)
+        if progress_q is self._progress_q:
+            self.after(50, self._drain_progress, progress_q)
+            
     def _complete(self, success):
+        self._progress_q = None
+        self.progress_bar.set(1 if success else 0)
         self.compress_btn.configure(state="normal", text="🗜️ COMPRESS IMAGE")
         if success:
-            self.status_label.configure(text="✓ Image compressed successfully", text_color=theme.SUCCESS)
-            messagebox.showinfo("Success", f"Image compressed!\n\nOutput: {self.output_file}")
+            self.update_status("✓ Image compressed successfully", theme.SUCCESS)
+            toast.show(self, f"Image compressed!\n\nOutput: {self.output_file}")
         else:
-            self.status_label.configure(text="✗ Compression failed", text_color=theme.ERROR)
+            self.update_status("✗ Compression failed", theme.ERROR)
             
     def _error(self, error_msg):
+        self._progress_q = None
+        self.progress_bar.set(0)
         self.compress_btn.configure(state="normal", text="🗜️ COMPRESS IMAGE")
-        self.status_label.configure(text="✗ Error", text_color=theme.ERROR)
+        self.update_status("✗ Error", theme.ERROR)
         messagebox.showerror("Error", f"An error occurred:\n\n{error_msg}")
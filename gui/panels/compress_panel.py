@@ -9,29 +9,32 @@ Features:
 """
 
 import customtkinter as ctk
+import os
+import re
 from pathlib import Path
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
-from pdf_wizard.controller import Controller
+from gui.theme import theme, font
 
 
-from gui.dnd import parse_dropped_files
+from gui import toast
+from gui.dnd import PDF_EXTS, parse_first_dropped_file
+from gui.panels.base_panel import BasePanel
+from gui.worker import EXECUTOR
 
-class CompressPanel(ctk.CTkFrame):
+
+# Plain number target sizes (in MB)
+_NUM_RE = re.compile(r'^\d+(?:\.\d+)?$')
+
+class CompressPanel(BasePanel):
     """Panel for compressing PDFs"""
     
     def __init__(self, parent):
-        super().__init__(
-            parent,
-            fg_color=theme.BG_PRIMARY,
-            corner_radius=0
-        )
+        super().__init__(parent)
         
-        self.grid_columnconfigure(0, weight=1)
         self.input_file = ""
         self.output_file = ""
+        self._last_dir = None  # Start dialogs where the user last picked a file
         
         self.create_widgets()
         
@@ -42,35 +45,35 @@ class CompressPanel(ctk.CTkFrame):
     def drop_file(self, event):
         """Handle file drop event"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     self.input_file = file
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
                     
                     # Auto-set output
-                    p = Path(file)
-                    output = str(p.with_name(f"{p.stem}_compressed{p.suffix}"))
+                    root, ext = os.path.splitext(file)
+                    output = f"{root}_compressed{ext}"
                     self.output_entry.delete(0, "end")
                     self.output_entry.insert(0, output)
                     self.output_file = output
                     
-                    self.status_label.configure(text=f"Selected: {p.name}", text_color=theme.INFO)
+                    self.update_status(f"Selected: {os.path.basename(file)}", theme.INFO)
                 else:
-                    self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
+                    self.update_status("Please drop a PDF file", theme.WARNING)
         except Exception as e:
             print(f"Drop error: {e}")
         
     def create_widgets(self):
         """Create all panel widgets"""
+        accent, accent_hover = theme.get_accent(), theme.get_accent_hover()
         
         # Header
         header = ctk.CTkLabel(
             self,
             text="Compress PDF",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -79,7 +82,7 @@ class CompressPanel(ctk.CTkFrame):
         subtitle = ctk.CTkLabel(
             self,
             text="Smart 3-stage compression to meet custom size targets",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14),
+            font=font(14),
             text_color=theme.TEXT_SECONDARY,
             anchor="w"
         )
@@ -92,7 +95,7 @@ class CompressPanel(ctk.CTkFrame):
         input_label = ctk.CTkLabel(
             input_frame,
             text="Input PDF",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -104,7 +107,7 @@ class CompressPanel(ctk.CTkFrame):
         self.input_entry = ctk.CTkEntry(
             input_path_frame,
             placeholder_text="Choose PDF to compress...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=40,
             fg_color=theme.BG_TERTIARY,
             border_color=theme.BORDER
@@ -115,7 +118,7 @@ class CompressPanel(ctk.CTkFrame):
             input_path_frame,
             text="📁 Browse",
             command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=100,
             height=40,
             fg_color=theme.BG_TERTIARY,
@@ -131,7 +134,7 @@ class CompressPanel(ctk.CTkFrame):
         settings_label = ctk.CTkLabel(
             settings_frame,
             text="Compression Settings",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -144,7 +147,7 @@ class CompressPanel(ctk.CTkFrame):
         quality_label = ctk.CTkLabel(
             quality_frame,
             text="Quality:",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            font=font(13),
             text_color=theme.TEXT_PRIMARY,
             width=120,
             anchor="w"
@@ -156,11 +159,11 @@ class CompressPanel(ctk.CTkFrame):
             quality_frame,
             values=["low", "medium", "high"],
             variable=self.quality_var,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
-            dropdown_font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
+            dropdown_font=font(13),
             fg_color=theme.BG_TERTIARY,
             button_color=theme.BG_TERTIARY,
-            button_hover_color=theme.get_accent(),
+            button_hover_color=accent,
             dropdown_fg_color=theme.BG_TERTIARY,
             width=200
         )
@@ -169,7 +172,7 @@ class CompressPanel(ctk.CTkFrame):
         quality_hint = ctk.CTkLabel(
             quality_frame,
             text="  low = aggressive, high = minimal loss",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=11),
+            font=font(11),
             text_color=theme.TEXT_SECONDARY
         )
         quality_hint.pack(side="left", padx=10)
@@ -181,7 +184,7 @@ class CompressPanel(ctk.CTkFrame):
         target_label = ctk.CTkLabel(
             target_frame,
             text="Target Size:",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            font=font(13),
             text_color=theme.TEXT_PRIMARY,
             width=120,
             anchor="w"
@@ -191,7 +194,7 @@ class CompressPanel(ctk.CTkFrame):
         self.target_entry = ctk.CTkEntry(
             target_frame,
             placeholder_text="2.0",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=100,
             height=35,
             fg_color=theme.BG_TERTIARY,
@@ -203,7 +206,7 @@ class CompressPanel(ctk.CTkFrame):
         unit_label = ctk.CTkLabel(
             target_frame,
             text=" MB  (or use KB like '500KB')",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=11),
+            font=font(11),
             text_color=theme.TEXT_SECONDARY
         )
         unit_label.pack(side="left", padx=10)
@@ -215,7 +218,7 @@ class CompressPanel(ctk.CTkFrame):
         output_label = ctk.CTkLabel(
             output_frame,
             text="Output File",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -227,7 +230,7 @@ class CompressPanel(ctk.CTkFrame):
         self.output_entry = ctk.CTkEntry(
             output_path_frame,
             placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=40,
             fg_color=theme.BG_TERTIARY,
             border_color=theme.BORDER
@@ -238,7 +241,7 @@ class CompressPanel(ctk.CTkFrame):
             output_path_frame,
             text="📁 Browse",
             command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=100,
             height=40,
             fg_color=theme.BG_TERTIARY,
@@ -255,10 +258,10 @@ class CompressPanel(ctk.CTkFrame):
             action_frame,
             text="⚡ COMPRESS PDF",
             command=self.compress_pdf,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=16, weight="bold"),
+            font=font(16, "bold"),
             height=50,
-            fg_color=theme.get_accent(),
-            hover_color=theme.get_accent_hover(),
+            fg_color=accent,
+            hover_color=accent_hover,
             corner_radius=10
         )
         self.compress_btn.pack(fill="x")
@@ -267,53 +270,50 @@ class CompressPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             self,
             text="Select a PDF file to compress",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            font=font(13),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.pack(fill="x", padx=30, pady=(0, 20))
         
     def browse_input(self):
         """Browse for input PDF file"""
+        self.update_idletasks()
         file = filedialog.askopenfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Select PDF to compress",
             filetypes=[("PDF files", "*.pdf")]
         )
         
         if file:
+            self._last_dir = os.path.dirname(file)
             self.input_file = file
             self.input_entry.delete(0, "end")
             self.input_entry.insert(0, file)
             
             # Auto-populate output
             if not self.output_file:
-                # Python 3.8 compatible replacement for with_stem
-                # original: output = str(Path(file).with_stem(Path(file).stem + "_compressed"))
-                p = Path(file)
-                output = str(p.with_name(f"{p.stem}_compressed{p.suffix}"))
+                root, ext = os.path.splitext(file)
+                output = f"{root}_compressed{ext}"
                 self.output_entry.delete(0, "end")
                 self.output_entry.insert(0, output)
                 self.output_file = output
             
     def browse_output(self):
         """Browse for output file location"""
+        self.update_idletasks()
         file = filedialog.asksaveasfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Save compressed PDF as",
             defaultextension=".pdf",
             filetypes=[("PDF files", "*.pdf")]
         )
         
         if file:
+            self._last_dir = os.path.dirname(file)
             self.output_file = file
             self.output_entry.delete(0, "end")
             self.output_entry.insert(0, file)
             
-    def update_status(self, message, color=None):
-        """Update the status label"""
-        self.status_label.configure(
-            text=message,
-            text_color=color or theme.TEXT_SECONDARY
-        )
-        
     def compress_pdf(self):
         """Execute compression"""
         # Validation
@@ -321,6 +321,10 @@ class CompressPanel(ctk.CTkFrame):
             messagebox.showerror("Error", "Please select an input PDF file")
             return
             
+        if not os.path.isfile(self.input_file):
+            messagebox.showerror("Error", f"Input file not found:\n{self.input_file}")
+            return
+            
         if not self.output_file:
             messagebox.showerror("Error", "Please choose an output location")
             return
@@ -334,20 +338,21 @@ class CompressPanel(ctk.CTkFrame):
         self.compress_btn.configure(state="disabled", text="Compressing...")
         self.update_status("Compressing PDF...", theme.INFO)
         
-        # Run in thread
-        thread = threading.Thread(
-            target=self._do_compress,
-            args=(target, self.quality_var.get())
-        )
-        thread.start()
+        # Run on the shared worker pool
+        EXECUTOR.submit(self._do_compress, target, self.quality_var.get())
         
     def _do_compress(self, target_size, quality):
         """Perform compression in background thread"""
+        # Imported here so Pillow/PyMuPDF load on the worker thread, not at GUI startup
+        from pdf_wizard.controller import Controller
+        from pdf_wizard.utils import parse_size_string
         try:
+            # Plain numbers are MB; sizes with units like '500KB' go through the CLI parser
+            target_mb = float(target_size) if _NUM_RE.match(target_size) else parse_size_string(target_size)
             success = Controller.compress_pdf(
                 self.input_file,
                 self.output_file,
-                float(target_size) if target_size.replace('.', '').isdigit() else target_size,
+                target_mb,
                 quality
             )
             
@@ -362,7 +367,7 @@ class CompressPanel(ctk.CTkFrame):
         
         if success:
             self.update_status(f"✓ Successfully compressed to {Path(self.output_file).name}", theme.SUCCESS)
-            messagebox.showinfo("Success", f"PDF compressed successfully!\n\nOutput: {self.output_file}")
+            toast.show(self, f"PDF compressed successfully!\n\nOutput: {self.output_file}")
         else:
             self.update_status("✗ Compression failed", theme.ERROR)
             
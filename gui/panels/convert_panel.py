@@ -3,27 +3,36 @@ Convert Panel - Convert images to PDF or PDF pages to images
 """
 
 import customtkinter as ctk
-from pathlib import Path
-from tkinter import filedialog, messagebox
+import os
 import threading
+from collections import OrderedDict
+from tkinter import filedialog, messagebox
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, IMG_EXTS, parse_first_dropped_file
+from gui.panels.base_panel import BasePanel
+from gui.worker import EXECUTOR, UI_EXECUTOR
 
-class ConvertPanel(ctk.CTkFrame):
+_PREVIEW_CACHE_SIZE = 8
+
+class ConvertPanel(BasePanel):
     """Panel for file format conversion"""
     
     def __init__(self, parent):
-        super().__init__(parent, fg_color=theme.BG_PRIMARY, corner_radius=0)
+        super().__init__(parent)
         
-        self.grid_columnconfigure(0, weight=1)
-        self.input_file = ""
-        self.output_file = ""
+        self.input_files = []
+        self.output_path = ""
         self.mode = "img2pdf"  # or "pdf2img"
         
+        # First-page thumbnails keyed by (real path, mtime), most recent last
+        self._preview_cache = OrderedDict()
+        self._preview_lock = threading.Lock()
+        self._preview_path = None  # PDF whose preview should be shown
+        
         self.create_widgets()
         
         # Enable Drag & Drop
@@ -32,48 +41,45 @@ class ConvertPanel(ctk.CTkFrame):
         
     def drop_file(self, event):
         """Handle file drop event"""
+        # Parse and validate off the Tk thread
+        UI_EXECUTOR.submit(self._validate_drop, event.data, self.mode)
+        
+    def _validate_drop(self, data, mode):
+        """Pick the first dropped file and check it suits the mode (runs in a worker thread)"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
+            file = parse_first_dropped_file(data)
+            if file:
+                ext = os.path.splitext(file)[1].lower()
                 # Validate based on mode
-                valid = False
-                if self.mode == "img2pdf":
-                    if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-                        valid = True
-                else: # pdf2img
-                    if file.lower().endswith('.pdf'):
-                        valid = True
-                        
-                if valid:
-                    self.input_file = file
-                    self.input_entry.delete(0, "end")
-                    self.input_entry.insert(0, file)
-                    self.status_label.configure(text=f"Selected: {Path(file).name}", text_color=theme.INFO)
-                else:
-                    msg = "Please drop an image file" if self.mode == "img2pdf" else "Please drop a PDF file"
-                    self.status_label.configure(text=msg, text_color=theme.WARNING)
+                valid = ext in IMG_EXTS if mode == "img2pdf" else ext in PDF_EXTS
+                self.after(0, self._apply_drop, file, valid, mode)
         except Exception as e:
             print(f"Drop error: {e}")
+            
+    def _apply_drop(self, file, valid, mode):
+        """Show the validated drop on the Tk thread unless the mode has changed"""
+        if mode != self.mode:
+            return
+        if valid:
+            self.input_files = [file]
+            self.input_entry.delete(0, "end")
+            self.input_entry.insert(0, file)
+            self.update_status(f"Selected: {os.path.basename(file)}", theme.INFO)
+            if mode == "pdf2img":
+                self._request_preview(file)
+        else:
+            msg = "Please drop an image file" if mode == "img2pdf" else "Please drop a PDF file"
+            self.update_status(msg, theme.WARNING)
         
     def create_widgets(self):
         # Header
-        ctk.CTkLabel(
-            self, text="Convert Files", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
-            text_color=theme.TEXT_PRIMARY, anchor="w"
-        ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
-        
-        ctk.CTkLabel(
-            self, text="Convert images to PDF or extract PDF pages as images",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
-        ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
+        self._make_header("Convert Files", "Convert images to PDF or extract PDF pages as images")
         
         # Mode selection
-        mode_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        mode_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
+        mode_frame = self._section_frame(2)
         
         ctk.CTkLabel(
-            mode_frame, text="Conversion Type", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            mode_frame, text="Conversion Type", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -82,7 +88,7 @@ class ConvertPanel(ctk.CTkFrame):
         
         self.img2pdf_btn = ctk.CTkButton(
             btn_frame, text="🖼️ → 📄 Images to PDF", command=lambda: self.set_mode("img2pdf"),
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             height=38, corner_radius=8
         )
@@ -90,18 +96,17 @@ class ConvertPanel(ctk.CTkFrame):
         
         self.pdf2img_btn = ctk.CTkButton(
             btn_frame, text="📄 → 🖼️ PDF to Images", command=lambda: self.set_mode("pdf2img"),
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.BG_TERTIARY, hover_color=theme.get_accent_hover(),
             height=38, corner_radius=8
         )
         self.pdf2img_btn.pack(side="left", fill="x", expand=True)
         
         # Input
-        input_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        input_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
+        input_frame = self._section_frame(3)
         
         self.input_label = ctk.CTkLabel(
-            input_frame, text="Input Images", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input Images", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         )
         self.input_label.pack(fill="x", padx=20, pady=(15, 10))
@@ -111,24 +116,26 @@ class ConvertPanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose files...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
         
+        # First-page preview, packed once a PDF is selected in pdf2img mode
+        self.preview_label = ctk.CTkLabel(input_frame, text="")
+        
         # Output
-        output_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        output_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
+        output_frame = self._section_frame(4)
         
         self.output_label = ctk.CTkLabel(
-            output_frame, text="Output PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         )
         self.output_label.pack(fill="x", padx=20, pady=(15, 10))
@@ -138,14 +145,14 @@ class ConvertPanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -153,35 +160,44 @@ class ConvertPanel(ctk.CTkFrame):
         # Convert button
         self.convert_btn = ctk.CTkButton(
             self, text="🔄 CONVERT", command=self.convert_files,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
         self.convert_btn.grid(row=5, column=0, sticky="ew", padx=30, pady=(0, 10))
         
         # Status
-        self.status_label = ctk.CTkLabel(
-            self, text="Select images to convert", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
-            text_color=theme.TEXT_SECONDARY
-        )
-        self.status_label.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 15))
+        self._make_status(6, "Select images to convert")
+        
+        # Widget settings per mode, built once so set_mode only replays them
+        accent = theme.get_accent()
+        self._mode_cfgs = {
+            "img2pdf": [
+                (self.img2pdf_btn, {"fg_color": accent}),
+                (self.pdf2img_btn, {"fg_color": theme.BG_TERTIARY}),
+                (self.input_label, {"text": "Input Images"}),
+                (self.output_label, {"text": "Output PDF"}),
+                (self.input_entry, {"placeholder_text": "Choose image files..."}),
+                (self.output_entry, {"placeholder_text": "Save PDF as..."}),
+            ],
+            "pdf2img": [
+                (self.img2pdf_btn, {"fg_color": theme.BG_TERTIARY}),
+                (self.pdf2img_btn, {"fg_color": accent}),
+                (self.input_label, {"text": "Input PDF"}),
+                (self.output_label, {"text": "Output Directory"}),
+                (self.input_entry, {"placeholder_text": "Choose PDF file..."}),
+                (self.output_entry, {"placeholder_text": "Choose output folder..."}),
+            ],
+        }
         
     def set_mode(self, mode):
+        # Re-clicking the active mode has nothing to change
+        if mode == self.mode:
+            return
         self.mode = mode
-        if mode == "img2pdf":
-            self.img2pdf_btn.configure(fg_color=theme.get_accent())
-            self.pdf2img_btn.configure(fg_color=theme.BG_TERTIARY)
-            self.input_label.configure(text="Input Images")
-            self.output_label.configure(text="Output PDF")
-            self.input_entry.configure(placeholder_text="Choose image files...")
-            self.output_entry.configure(placeholder_text="Save PDF as...")
-        else:
-            self.img2pdf_btn.configure(fg_color=theme.BG_TERTIARY)
-            self.pdf2img_btn.configure(fg_color=theme.get_accent())
-            self.input_label.configure(text="Input PDF")
-            self.output_label.configure(text="Output Directory")
-            self.input_entry.configure(placeholder_text="Choose PDF file...")
-            self.output_entry.configure(placeholder_text="Choose output folder...")
+        self._clear_preview()
+        for widget, kwargs in self._mode_cfgs[mode]:
+            widget.configure(**kwargs)
             
     def browse_input(self):
         if self.mode == "img2pdf":
@@ -198,6 +214,45 @@ class ConvertPanel(ctk.CTkFrame):
                 self.input_files = [file]
                 self.input_entry.delete(0, "end")
                 self.input_entry.insert(0, file)
+                self._request_preview(file)
+            
+    def _request_preview(self, path):
+        """Render a thumbnail of the PDF's first page in the background"""
+        self._preview_path = path
+        UI_EXECUTOR.submit(self._render_preview, path)
+        
+    def _render_preview(self, path):
+        """Fetch the thumbnail from the cache or render it (runs in a worker thread)"""
+        try:
+            key = (os.path.realpath(path), os.stat(path).st_mtime_ns)
+            with self._preview_lock:
+                img = self._preview_cache.get(key)
+                if img is not None:
+                    self._preview_cache.move_to_end(key)
+            
+            if img is None:
+                img = Controller.pdf_page_preview(path)
+                if img is None:
+                    return
+                with self._preview_lock:
+                    self._preview_cache[key] = img
+                    if len(self._preview_cache) > _PREVIEW_CACHE_SIZE:
+                        self._preview_cache.popitem(last=False)
+            
+            self.after(0, self._show_preview, path, img)
+        except Exception as e:
+            print(f"Preview error: {e}")
+            
+    def _show_preview(self, path, img):
+        """Display a rendered thumbnail unless the selection has moved on"""
+        if path != self._preview_path or self.mode != "pdf2img":
+            return
+        self.preview_label.configure(image=ctk.CTkImage(light_image=img, dark_image=img, size=img.size))
+        self.preview_label.pack(padx=20, pady=(0, 15))
+        
+    def _clear_preview(self):
+        self._preview_path = None
+        self.preview_label.pack_forget()
             
     def browse_output(self):
         if self.mode == "img2pdf":
@@ -221,9 +276,9 @@ class ConvertPanel(ctk.CTkFrame):
             return
             
         self.convert_btn.configure(state="disabled", text="Converting...")
-        self.status_label.configure(text="Converting...", text_color=theme.INFO)
+        self.update_status("Converting...", theme.INFO)
         
-        threading.Thread(target=self._do_convert).start()
+        EXECUTOR.submit(self._do_convert)
         
     def _do_convert(self):
         try:
@@ -238,12 +293,12 @@ class ConvertPanel(ctk.CTkFrame):
     def _complete(self, success):
         self.convert_btn.configure(state="normal", text="🔄 CONVERT")
         if success:
-            self.status_label.configure(text="✓ Conversion successful", text_color=theme.SUCCESS)
+            self.update_status("✓ Conversion successful", theme.SUCCESS)
             messagebox.showinfo("Success", f"Files converted!\n\nOutput: {self.output_path}")
         else:
-            self.status_label.configure(text="✗ Conversion failed", text_color=theme.ERROR)
+            self.update_status("✗ Conversion failed", theme.ERROR)
             
     def _error(self, error_msg):
         self.convert_btn.configure(state="normal", text="🔄 CONVERT")
-        self.status_label.configure(text="✗ Error", text_color=theme.ERROR)
+        self.update_status("✗ Error", theme.ERROR)
         messagebox.showerror("Error", f"An error occurred:\n\n{error_msg}")
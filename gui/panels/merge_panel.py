@@ -9,31 +9,32 @@ Features:
 """
 
 import customtkinter as ctk
+import os
 from pathlib import Path
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, parse_dropped_files
+from gui.panels.base_panel import BasePanel
+from gui.worker import EXECUTOR, UI_EXECUTOR
 
-class MergePanel(ctk.CTkFrame):
+
+class MergePanel(BasePanel):
     """Panel for merging PDFs"""
     
     def __init__(self, parent):
-        super().__init__(
-            parent,
-            fg_color=theme.BG_PRIMARY,
-            corner_radius=0
-        )
+        super().__init__(parent)
         
         # Configure grid for responsive layout
-        self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)  # File list expands
         
         self.files = []
+        self._file_names = []  # Basenames parallel to self.files, for the list display
+        self._file_set = set()  # Real paths already in self.files
+        self._last_rendered_hash = None  # hash(tuple(self.files)) currently shown
         self.output_path = ""
         
         self.create_widgets()
@@ -44,46 +45,43 @@ class MergePanel(ctk.CTkFrame):
         
     def drop_files(self, event):
         """Handle file drop event"""
+        # Parsing and resolving a large drop runs off the Tk thread
+        self.update_status("Checking dropped files...", theme.INFO)
+        UI_EXECUTOR.submit(self._validate_drop, event.data)
+        
+    def _validate_drop(self, data):
+        """Parse dropped paths and keep the PDFs (runs in a worker thread)"""
         try:
             # Parse dropped files (handle paths with spaces and {})
-            files = parse_dropped_files(event.data)
-            valid_files = [f for f in files if f.lower().endswith('.pdf')]
-            
-            if valid_files:
-                self.files.extend(valid_files)
-                self.update_file_list()
-                self.update_status(f"Added {len(valid_files)} file(s) via drag & drop")
-            else:
-                self.update_status("No valid PDF files dropped", theme.WARNING)
+            files = parse_dropped_files(data)
+            entries = [
+                (f, os.path.realpath(f)) for f in files
+                if os.path.splitext(f)[1].lower() in PDF_EXTS
+            ]
+            self.after(0, self._apply_drop, entries)
         except Exception as e:
             print(f"Drop error: {e}")
             
+    def _apply_drop(self, entries):
+        """Add validated dropped files on the Tk thread"""
+        if entries:
+            added = self._add_files(entries)
+            if added:
+                self.update_status(f"Added {added} file(s) via drag & drop")
+            else:
+                self.update_status("Files are already in the list", theme.WARNING)
+        else:
+            self.update_status("No valid PDF files dropped", theme.WARNING)
+            
     def create_widgets(self):
         """Create all panel widgets"""
         
         # Header
-        header = ctk.CTkLabel(
-            self,
-            text="Merge PDFs",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
-            text_color=theme.TEXT_PRIMARY,
-            anchor="w"
-        )
-        header.grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
-        
-        subtitle = ctk.CTkLabel(
-            self,
-            text="Combine multiple PDF files into a single document",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14),
-            text_color=theme.TEXT_SECONDARY,
-            anchor="w"
-        )
-        subtitle.grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
+        self._make_header("Merge PDFs", "Combine multiple PDF files into a single document")
         
         
         # Files section (expandable)
-        files_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        files_frame.grid(row=2, column=0, sticky="nsew", padx=30, pady=(0, 15))
+        files_frame = self._section_frame(2, sticky="nsew")
         files_frame.grid_columnconfigure(0, weight=1)
         files_frame.grid_rowconfigure(1, weight=1)
         
@@ -91,7 +89,7 @@ class MergePanel(ctk.CTkFrame):
         files_header = ctk.CTkLabel(
             files_frame,
             text="Files to Merge",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=16, weight="bold"),
+            font=font(16, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -102,7 +100,7 @@ class MergePanel(ctk.CTkFrame):
             files_frame,
             fg_color=theme.BG_TERTIARY,
             text_color=theme.TEXT_PRIMARY,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=12)
+            font=font(12)
         )
         self.file_listbox.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 10))
         
@@ -115,7 +113,7 @@ class MergePanel(ctk.CTkFrame):
             btn_frame,
             text="+ Add Files",
             command=self.add_files,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.get_accent(),
             hover_color=theme.get_accent_hover(),
             height=35,
@@ -127,7 +125,7 @@ class MergePanel(ctk.CTkFrame):
             btn_frame,
             text="Clear All",
             command=self.clear_files,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.BG_TERTIARY,
             hover_color=theme.ERROR,
             height=35,
@@ -136,13 +134,12 @@ class MergePanel(ctk.CTkFrame):
         clear_btn.pack(side="left")
         
         # Output section
-        output_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        output_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
+        output_frame = self._section_frame(3)
         
         output_label = ctk.CTkLabel(
             output_frame,
             text="Output File",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY,
             anchor="w"
         )
@@ -154,7 +151,7 @@ class MergePanel(ctk.CTkFrame):
         self.output_entry = ctk.CTkEntry(
             output_path_frame,
             placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35,
             fg_color=theme.BG_TERTIARY,
             border_color=theme.BORDER
@@ -165,7 +162,7 @@ class MergePanel(ctk.CTkFrame):
             output_path_frame,
             text="📁",
             command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50,
             height=35,
             fg_color=theme.BG_TERTIARY,
@@ -179,7 +176,7 @@ class MergePanel(ctk.CTkFrame):
             self,
             text="🔗 MERGE PDFS",
             command=self.merge_pdfs,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"),
+            font=font(15, "bold"),
             height=45,
             fg_color=theme.get_accent(),
             hover_color=theme.get_accent_hover(),
@@ -188,13 +185,7 @@ class MergePanel(ctk.CTkFrame):
         self.merge_btn.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 10))
         
         # Status label
-        self.status_label = ctk.CTkLabel(
-            self,
-            text="Add PDF files to begin",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
-            text_color=theme.TEXT_SECONDARY
-        )
-        self.status_label.grid(row=5, column=0, sticky="ew", padx=30, pady=(0, 15))
+        self._make_status(5, "Add PDF files to begin")
         
     def add_files(self):
         """Open file dialog to add PDF files"""
@@ -204,26 +195,51 @@ class MergePanel(ctk.CTkFrame):
         )
         
         if files:
-            self.files.extend(files)
+            added = self._add_files([(f, os.path.realpath(f)) for f in files])
+            if added:
+                self.update_status(f"Added {added} file(s)")
+            else:
+                self.update_status("Files are already in the list", theme.WARNING)
+            
+    def _add_files(self, entries):
+        """Append (path, real_path) entries not already in the list and return how many were new"""
+        added = 0
+        for path, real_path in entries:
+            if real_path not in self._file_set:
+                self._file_set.add(real_path)
+                self.files.append(path)
+                self._file_names.append(os.path.basename(path))
+                added += 1
+        
+        # Nothing new - skip the redraw
+        if added:
             self.update_file_list()
-            self.update_status(f"Added {len(files)} file(s)")
+        return added
             
     def clear_files(self):
         """Clear all files from the list"""
         self.files = []
+        self._file_names = []
+        self._file_set.clear()
         self.update_file_list()
         self.update_status("Files cleared")
         
     def update_file_list(self):
         """Update the file listbox display"""
+        # Same list as last time (e.g. clearing an empty list) - leave the widget alone
+        h = hash(tuple(self.files))
+        if h == self._last_rendered_hash:
+            return
+        self._last_rendered_hash = h
+        
         self.file_listbox.delete("1.0", "end")
         
         if not self.files:
             self.file_listbox.insert("1.0", "No files added yet.\nClick '+ Add Files' or drag PDFs here.")
         else:
-            for i, file in enumerate(self.files, 1):
-                filename = Path(file).name
-                self.file_listbox.insert("end", f"{i}. {filename}\n")
+            # One insert for the whole list - a Tk insert per line re-lays out the widget each time
+            text = "".join(f"{i}. {name}\n" for i, name in enumerate(self._file_names, 1))
+            self.file_listbox.insert("1.0", text)
                 
     def browse_output(self):
         """Browse for output file location"""
@@ -247,13 +263,6 @@ class MergePanel(ctk.CTkFrame):
             self.output_entry.delete(0, "end")
             self.output_entry.insert(0, file)
             
-    def update_status(self, message, color=None):
-        """Update the status label"""
-        self.status_label.configure(
-            text=message,
-            text_color=color or theme.TEXT_SECONDARY
-        )
-        
     def merge_pdfs(self):
         """Execute the merge operation"""
         # Validation
@@ -269,9 +278,8 @@ class MergePanel(ctk.CTkFrame):
         self.merge_btn.configure(state="disabled", text="Merging...")
         self.update_status("Merging PDFs...", theme.INFO)
         
-        # Run in thread to keep UI responsive
-        thread = threading.Thread(target=self._do_merge)
-        thread.start()
+        # Run on the worker pool to keep UI responsive
+        EXECUTOR.submit(self._do_merge)
         
     def _do_merge(self):
         """Perform the merge in a background thread"""
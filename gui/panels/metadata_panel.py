@@ -3,23 +3,25 @@ Metadata Panel - View or strip PDF metadata
 """
 
 import customtkinter as ctk
+import os
 from pathlib import Path
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, parse_first_dropped_file
+from gui.panels.base_panel import BasePanel
+from gui.worker import EXECUTOR
 
-class MetadataPanel(ctk.CTkFrame):
+
+class MetadataPanel(BasePanel):
     """Panel for metadata operations"""
     
     def __init__(self, parent):
-        super().__init__(parent, fg_color=theme.BG_PRIMARY, corner_radius=0)
+        super().__init__(parent)
         
-        self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)  # Textbox expands
         self.input_file = ""
         
@@ -36,44 +38,34 @@ class MetadataPanel(ctk.CTkFrame):
     def drop_file(self, event):
         """Handle file drop event"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     self.input_file = file
-                    self.status_label.configure(text=f"Selected: {Path(file).name}", text_color=theme.INFO)
-                    threading.Thread(target=self._view_metadata).start()
+                    self.update_status(f"Selected: {Path(file).name}", theme.INFO)
+                    EXECUTOR.submit(self._view_metadata)
                 else:
-                    self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
+                    self.update_status("Please drop a PDF file", theme.WARNING)
         except Exception as e:
             print(f"Drop error: {e}")
         
     def create_widgets(self):
         # Header
-        ctk.CTkLabel(
-            self, text="PDF Metadata", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
-            text_color=theme.TEXT_PRIMARY, anchor="w"
-        ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
-        
-        ctk.CTkLabel(
-            self, text="View or remove PDF metadata for privacy",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
-        ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
+        self._make_header("PDF Metadata", "View or remove PDF metadata for privacy")
         
         # Info display
-        info_frame = ctk.CTkFrame(self, fg_color=theme.BG_SECONDARY, corner_radius=10)
-        info_frame.grid(row=2, column=0, sticky="nsew", padx=30, pady=(0, 15))
+        info_frame = self._section_frame(2, sticky="nsew")
         info_frame.grid_columnconfigure(0, weight=1)
         info_frame.grid_rowconfigure(1, weight=1)
         
         ctk.CTkLabel(
-            info_frame, text="Metadata Information", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            info_frame, text="Metadata Information", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=20, pady=(15, 10))
         
         self.info_textbox = ctk.CTkTextbox(
             info_frame, fg_color=theme.BG_TERTIARY,
-            text_color=theme.TEXT_PRIMARY, font=ctk.CTkFont(family=theme.FONT_FAMILY, size=12)
+            text_color=theme.TEXT_PRIMARY, font=font(12)
         )
         self.info_textbox.grid(row=1, column=0, sticky="nsew", padx=20, pady=(0, 15))
         self.info_textbox.insert("1.0", "Select a PDF file to view its metadata...")
@@ -86,31 +78,27 @@ class MetadataPanel(ctk.CTkFrame):
         
         ctk.CTkButton(
             btn_frame, text="📂 Select PDF", command=self.browse_file,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"), height=42,
+            font=font(14, "bold"), height=42,
             fg_color=theme.BG_TERTIARY, hover_color=theme.BG_SIDEBAR,
             corner_radius=10
         ).grid(row=0, column=0, sticky="ew", padx=(0, 8))
         
         ctk.CTkButton(
             btn_frame, text="🗑️ Strip Metadata", command=self.strip_metadata,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"), height=42,
+            font=font(14, "bold"), height=42,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         ).grid(row=0, column=1, sticky="ew")
         
         # Status
-        self.status_label = ctk.CTkLabel(
-            self, text="No file selected", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
-            text_color=theme.TEXT_SECONDARY
-        )
-        self.status_label.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
+        self._make_status(4, "No file selected")
         
     def browse_file(self):
         file = filedialog.askopenfilename(title="Select PDF", filetypes=[("PDF files", "*.pdf")])
         if file:
             self.input_file = file
-            self.status_label.configure(text=f"Selected: {Path(file).name}", text_color=theme.INFO)
-            threading.Thread(target=self._view_metadata).start()
+            self.update_status(f"Selected: {Path(file).name}", theme.INFO)
+            EXECUTOR.submit(self._view_metadata)
             
     def _view_metadata(self):
         try:
@@ -141,8 +129,8 @@ class MetadataPanel(ctk.CTkFrame):
         )
         
         if output:
-            self.status_label.configure(text="Stripping metadata...", text_color=theme.INFO)
-            threading.Thread(target=self._do_strip, args=(output,)).start()
+            self.update_status("Stripping metadata...", theme.INFO)
+            EXECUTOR.submit(self._do_strip, output)
             
     def _do_strip(self, output):
         try:
@@ -153,12 +141,12 @@ class MetadataPanel(ctk.CTkFrame):
             
     def _strip_complete(self, success, output):
         if success:
-            self.status_label.configure(text=f"✓ Metadata stripped", text_color=theme.SUCCESS)
+            self.update_status(f"✓ Metadata stripped", theme.SUCCESS)
             messagebox.showinfo("Success", f"Metadata removed!\n\nOutput: {output}")
         else:
-            self.status_label.configure(text="✗ Strip failed", text_color=theme.ERROR)
+            self.update_status("✗ Strip failed", theme.ERROR)
             
     def _error(self, error_msg):
-        self.status_label.configure(text="✗ Error", text_color=theme.ERROR)
+        self.update_status("✗ Error", theme.ERROR)
         self.info_textbox.delete("1.0", "end")
         self.info_textbox.insert("1.0", f"Error: {error_msg}")
@@ -3,15 +3,37 @@ Page Tools Panel - Academic PDF operations (reorder, auto-rotate, remove blanks,
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
+import re
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui import toast
+from gui.dnd import PDF_EXTS, parse_first_dropped_file, DropCoalescer
+from gui.worker import EXECUTOR
+
+
+# (row, column, button text, tool name, display name) for the tool button grid
+_TOOL_BUTTONS = (
+    (3, 0, "🗑️ Remove Blank Pages", "remove_blanks", "Remove Blank Pages"),
+    (3, 1, "🔄 Auto-Rotate Pages", "auto_rotate", "Auto-Rotate Pages"),
+    (4, 0, "🔢 Add Page Numbers", "add_numbers", "Add Page Numbers"),
+    (4, 1, "📑 Reorder Pages", "reorder", "Reorder Pages"),
+)
+
+# Page order as the engine accepts it: comma-separated pages or ranges, e.g. "1,3,2,4-10"
+_ORDER_RE = re.compile(r"\A\s*\d+(?:\s*-\s*\d+)?(?:\s*,\s*\d+(?:\s*-\s*\d+)?)*\s*\Z")
+
+# Default output-name suffix per tool
+_SUFFIX_MAP = {
+    "remove_blanks": "_no_blanks",
+    "auto_rotate": "_rotated",
+    "add_numbers": "_numbered",
+    "reorder": "_reordered",
+}
 
 class PageToolsPanel(ctk.CTkFrame):
     """Panel for page manipulation tools"""
@@ -22,25 +44,27 @@ class PageToolsPanel(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
         self.input_file = ""
-        self.output_file = ""
+        self._last_dir = None  # Start dialogs where the user last picked a file
+        self._suffix_outputs = {}  # Tool name -> default output file name for self.input_file
         
         self.create_widgets()
         
-        # Enable Drag & Drop
+        # Enable Drag & Drop (bursts from one gesture are handled once)
+        self.drop_file = DropCoalescer(self, self._process_drop)
         self.input_entry.drop_target_register('DND_Files')
         self.input_entry.dnd_bind('<<Drop>>', self.drop_file)
         
-    def drop_file(self, event):
-        """Handle file drop event"""
+    def _process_drop(self, data):
+        """Handle the last file drop of a burst"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            file = parse_first_dropped_file(data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     self.input_file = file
+                    self._rebuild_suffix_cache(file)
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
-                    self.status_label.configure(text=f"Selected: {Path(file).name}", text_color=theme.INFO)
+                    self.status_label.configure(text=f"Selected: {os.path.basename(file)}", text_color=theme.INFO)
                 else:
                     self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
         except Exception as e:
@@ -49,13 +73,13 @@ class PageToolsPanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="Page Tools", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="Page Tools", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, columnspan=2, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Academic PDF tools: reorder, rotate, remove blanks, add page numbers",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, columnspan=2, sticky="ew", padx=30, pady=(0, 20))
         
         # Input
@@ -63,7 +87,7 @@ class PageToolsPanel(ctk.CTkFrame):
         input_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Input PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -72,66 +96,74 @@ class PageToolsPanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose PDF file...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
         
         # Tool buttons - Grid layout (2 columns)
-        # Row 1
-        self.create_tool_button(
-            3, 0, "🗑️ Remove Blank Pages", 
-            lambda: self.run_tool("remove_blanks", "Remove Blank Pages")
-        )
-        self.create_tool_button(
-            3, 1, "🔄 Auto-Rotate Pages", 
-            lambda: self.run_tool("auto_rotate", "Auto-Rotate Pages")
-        )
-        
-        # Row 2
-        self.create_tool_button(
-            4, 0, "🔢 Add Page Numbers", 
-            lambda: self.run_tool("add_numbers", "Add Page Numbers")
-        )
-        self.create_tool_button(
-            4, 1, "📑 Reorder Pages", 
-            lambda: self.reorder_pages()
-        )
+        accent = theme.get_accent()
+        for row, col, text, tool_name, display_name in _TOOL_BUTTONS:
+            if tool_name == "reorder":
+                command = self.reorder_pages  # Asks for the page order first
+            else:
+                command = lambda t=tool_name, d=display_name: self.run_tool(t, d)
+            self.create_tool_button(row, col, text, command, accent)
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select a PDF and choose a tool", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select a PDF and choose a tool", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=5, column=0, columnspan=2, sticky="ew", padx=30, pady=(15, 15))
         
-    def create_tool_button(self, row, col, text, command):
+    def create_tool_button(self, row, col, text, command, hover_color):
         """Helper to create a tool button"""
         btn = ctk.CTkButton(
             self, text=text, command=command,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"), height=60,
-            fg_color=theme.BG_SECONDARY, hover_color=theme.get_accent(),
+            font=font(14, "bold"), height=60,
+            fg_color=theme.BG_SECONDARY, hover_color=hover_color,
             corner_radius=10, border_width=2, border_color=theme.BORDER
         )
         btn.grid(row=row, column=col, sticky="ew", padx=(30 if col == 0 else 8, 8 if col == 0 else 30), pady=8)
         
     def browse_input(self):
-        file = filedialog.askopenfilename(title="Select PDF", filetypes=[("PDF files", "*.pdf")])
+        self.update_idletasks()
+        file = filedialog.askopenfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
+            title="Select PDF", filetypes=[("PDF files", "*.pdf")]
+        )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.input_file = file
+            self._rebuild_suffix_cache(file)
             self.input_entry.delete(0, "end" )
             self.input_entry.insert(0, file)
-            self.status_label.configure(text=f"Selected: {Path(file).name}", text_color=theme.INFO)
+            self.status_label.configure(text=f"Selected: {os.path.basename(file)}", text_color=theme.INFO)
+            
+    def _rebuild_suffix_cache(self, input_path):
+        """Work out every tool's default output name once, when the input changes"""
+        stem, ext = os.path.splitext(os.path.basename(input_path))
+        self._suffix_outputs = {tool: f"{stem}{suffix}{ext}" for tool, suffix in _SUFFIX_MAP.items()}
+            
+    def _sync_input(self):
+        """Pick up a path typed or pasted into the entry since the last drop/browse"""
+        file = self.input_entry.get().strip()
+        if file != self.input_file:
+            self.input_file = file
+            if file:
+                self._rebuild_suffix_cache(file)
             
     def reorder_pages(self):
         """Handle page reordering with dialog"""
+        self._sync_input()
         if not self.input_file:
             messagebox.showerror("Error", "Please select a PDF file first")
             return
@@ -143,19 +175,25 @@ class PageToolsPanel(ctk.CTkFrame):
         ).get_input()
         
         if order:
-            # Python 3.8 compatible replacement for with_stem based initialfile
-            p = Path(self.input_file)
-            initial = f"{p.stem}_reordered{p.suffix}"
+            # Reject malformed input before the save dialog, not after the job starts
+            if not _ORDER_RE.match(order):
+                messagebox.showerror("Error", "Page order must be comma-separated page numbers or ranges (e.g. 1,3,2,4-10)")
+                return
             
+            initial = self._suffix_outputs["reorder"]
+            
+            self.update_idletasks()
             output = filedialog.asksaveasfilename(
+                initialdir=self._last_dir or os.path.expanduser("~"),
                 title="Save reordered PDF as", defaultextension=".pdf",
                 initialfile=initial,
                 filetypes=[("PDF files", "*.pdf")]
             )
             
             if output:
+                self._last_dir = os.path.dirname(output)
                 self.status_label.configure(text="Reordering pages...", text_color=theme.INFO)
-                threading.Thread(target=self._do_reorder, args=(order, output)).start()
+                EXECUTOR.submit(self._do_reorder, order, output)
                 
     def _do_reorder(self, order, output):
         try:
@@ -166,29 +204,25 @@ class PageToolsPanel(ctk.CTkFrame):
             
     def run_tool(self, tool_name, display_name):
         """Run a specific tool"""
+        self._sync_input()
         if not self.input_file:
             messagebox.showerror("Error", "Please select a PDF file first")
             return
             
-        suffix_map = {
-            "remove_blanks": "_no_blanks",
-            "auto_rotate": "_rotated",
-            "add_numbers": "_numbered"
-        }
-        
-        p = Path(self.input_file)
-        suffix = suffix_map.get(tool_name, "_modified")
-        initial = f"{p.stem}{suffix}{p.suffix}"
+        initial = self._suffix_outputs[tool_name]
         
+        self.update_idletasks()
         output = filedialog.asksaveasfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title=f"Save {display_name.lower()} PDF as", defaultextension=".pdf",
             initialfile=initial,
             filetypes=[("PDF files", "*.pdf")]
         )
         
         if output:
+            self._last_dir = os.path.dirname(output)
             self.status_label.configure(text=f"Processing with {display_name}...", text_color=theme.INFO)
-            threading.Thread(target=self._do_tool, args=(tool_name, output)).start()
+            EXECUTOR.submit(self._do_tool, tool_name, output)
             
     def _do_tool(self, tool_name, output):
         try:
@@ -208,7 +242,7 @@ class PageToolsPanel(ctk.CTkFrame):
     def _complete(self, success, output, tool_name):
         if success:
             self.status_label.configure(text=f"✓ Operation completed successfully", text_color=theme.SUCCESS)
-            messagebox.showinfo("Success", f"PDF processed!\n\nOutput: {output}")
+            toast.show(self, f"PDF processed!\n\nOutput: {output}")
         else:
             self.status_label.configure(text="✗ Operation failed", text_color=theme.ERROR)
             
@@ -3,15 +3,23 @@ QR Generator Panel - Create QR codes for PDF verification
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui import toast
+from gui.dnd import PDF_EXTS, parse_first_dropped_file, DropCoalescer
+from gui.worker import EXECUTOR
+
+
+
+def _default_qr_output(path):
+    """<input without extension>_qr.png, next to the input"""
+    root, _ = os.path.splitext(path)
+    return f"{root}_qr.png"
 
 class QRPanel(ctk.CTkFrame):
     """Panel for generating QR codes"""
@@ -22,30 +30,22 @@ class QRPanel(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.input_file = ""
         self.output_file = ""
+        self._last_dir = None  # Start dialogs where the user last picked a file
         
         self.create_widgets()
         
-        # Enable Drag & Drop
+        # Enable Drag & Drop (bursts from one gesture are handled once)
+        self.drop_file = DropCoalescer(self, self._process_drop)
         self.input_entry.drop_target_register('DND_Files')
         self.input_entry.dnd_bind('<<Drop>>', self.drop_file)
         
-    def drop_file(self, event):
-        """Handle file drop event"""
+    def _process_drop(self, data):
+        """Handle the last file drop of a burst"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
-                    self.input_file = file
-                    self.input_entry.delete(0, "end")
-                    self.input_entry.insert(0, file)
-                    
-                    # Auto-set output
-                    if not self.output_file:
-                         output = str(Path(file).with_suffix('.png')).replace('.pdf', '_qr.png')
-                         self.output_entry.delete(0, "end")
-                         self.output_entry.insert(0, output)
-                         self.output_file = output
+            file = parse_first_dropped_file(data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
+                    self._set_input(file)
                 else:
                     self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
         except Exception as e:
@@ -54,13 +54,13 @@ class QRPanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="QR Code Generator", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="QR Code Generator", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Generate QR code with document hash for verification",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Input PDF
@@ -68,7 +68,7 @@ class QRPanel(ctk.CTkFrame):
         input_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Document to Verify", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Document to Verify", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -77,14 +77,14 @@ class QRPanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose PDF file...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -94,7 +94,7 @@ class QRPanel(ctk.CTkFrame):
         output_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Output QR Code", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output QR Code", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -103,14 +103,14 @@ class QRPanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -118,7 +118,7 @@ class QRPanel(ctk.CTkFrame):
         # Generate button
         self.gen_btn = ctk.CTkButton(
             self, text="📱 GENERATE QR CODE", command=self.generate_qr,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
@@ -126,36 +126,53 @@ class QRPanel(ctk.CTkFrame):
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select a PDF to generate QR code", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select a PDF to generate QR code", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=5, column=0, sticky="ew", padx=30, pady=(0, 15))
         
     def browse_input(self):
-        file = filedialog.askopenfilename(title="Select PDF", filetypes=[("PDF files", "*.pdf")])
+        self.update_idletasks()
+        file = filedialog.askopenfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
+            title="Select PDF", filetypes=[("PDF files", "*.pdf")]
+        )
         if file:
-            self.input_file = file
-            self.input_entry.delete(0, "end")
-            self.input_entry.insert(0, file)
+            self._last_dir = os.path.dirname(file)
+            self._set_input(file)
             
-            # Auto-populate output
-            if not self.output_file:
-                output = str(Path(file).with_suffix('.png')).replace('.pdf', '_qr.png')
-                self.output_entry.delete(0, "end")
-                self.output_entry.insert(0, output)
-                self.output_file = output
+    def _set_input(self, file):
+        """Select the input PDF and auto-populate the output if none is chosen"""
+        self.input_file = file
+        self.input_entry.delete(0, "end")
+        self.input_entry.insert(0, file)
+        
+        if not self.output_file:
+            output = _default_qr_output(file)
+            self.output_entry.delete(0, "end")
+            self.output_entry.insert(0, output)
+            self.output_file = output
             
     def browse_output(self):
+        self.update_idletasks()
         file = filedialog.asksaveasfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Save QR code as", defaultextension=".png",
             filetypes=[("PNG", "*.png"), ("PDF", "*.pdf")]
         )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.output_file = file
             self.output_entry.delete(0, "end")
             self.output_entry.insert(0, file)
             
+    def _sync_paths(self):
+        """Pick up paths typed or pasted into the entries since the last drop/browse"""
+        self.input_file = self.input_entry.get().strip()
+        self.output_file = self.output_entry.get().strip()
+        
     def generate_qr(self):
+        self._sync_paths()
         if not self.input_file or not self.output_file:
             messagebox.showerror("Error", "Please select input PDF and output location")
             return
@@ -163,7 +180,7 @@ class QRPanel(ctk.CTkFrame):
         self.gen_btn.configure(state="disabled", text="Generating...")
         self.status_label.configure(text="Generating QR code...", text_color=theme.INFO)
         
-        threading.Thread(target=self._do_generate).start()
+        EXECUTOR.submit(self._do_generate)
         
     def _do_generate(self):
         try:
@@ -176,7 +193,7 @@ class QRPanel(ctk.CTkFrame):
         self.gen_btn.configure(state="normal", text="📱 GENERATE QR CODE")
         if success:
             self.status_label.configure(text="✓ QR code generated successfully", text_color=theme.SUCCESS)
-            messagebox.showinfo("Success", f"QR code created!\n\nOutput: {self.output_file}")
+            toast.show(self, f"QR code created!\n\nOutput: {self.output_file}")
         else:
             self.status_label.configure(text="✗ Generation failed", text_color=theme.ERROR)
             
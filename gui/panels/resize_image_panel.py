@@ -3,15 +3,17 @@ Image Resize Panel - GUI for resizing images (including passport photos)
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui import toast
+from gui.dnd import IMG_EXTS, parse_first_dropped_file, DropCoalescer
+from gui.worker import EXECUTOR
+
 
 class ResizeImagePanel(ctk.CTkFrame):
     """Panel for resizing images"""
@@ -22,27 +24,28 @@ class ResizeImagePanel(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         self.input_file = ""
         self.output_file = ""
+        self._last_dir = None  # Start dialogs where the user last picked a file
         
         self.create_widgets()
         
-        # Enable Drag & Drop
+        # Enable Drag & Drop (bursts from one gesture are handled once)
+        self.drop_file = DropCoalescer(self, self._process_drop)
         self.input_entry.drop_target_register('DND_Files')
         self.input_entry.dnd_bind('<<Drop>>', self.drop_file)
         
-    def drop_file(self, event):
-        """Handle file drop event"""
+    def _process_drop(self, data):
+        """Handle the last file drop of a burst"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith(('.jpg', '.jpeg', '.png')):
+            file = parse_first_dropped_file(data)
+            if file:
+                if os.path.splitext(file)[1].lower() in IMG_EXTS:
                     self.input_file = file
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
                     
                     # Auto-set output
-                    p = Path(file)
-                    output = str(p.with_name(f"{p.stem}_resized{p.suffix}"))
+                    root, ext = os.path.splitext(file)
+                    output = f"{root}_resized{ext}"
                     self.output_entry.delete(0, "end")
                     self.output_entry.insert(0, output)
                     self.output_file = output
@@ -54,13 +57,13 @@ class ResizeImagePanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="Resize Image", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="Resize Image", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Perfect for passport photos - resize with dimensions + file size targets",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Input
@@ -68,7 +71,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         input_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Input Image", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input Image", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -77,14 +80,14 @@ class ResizeImagePanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose image file...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -94,7 +97,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         settings_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            settings_frame, text="Resize Settings", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            settings_frame, text="Resize Settings", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -103,20 +106,20 @@ class ResizeImagePanel(ctk.CTkFrame):
         dim_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         ctk.CTkLabel(
-            dim_frame, text="Dimensions:", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            dim_frame, text="Dimensions:", font=font(13),
             text_color=theme.TEXT_PRIMARY, width=120, anchor="w"
         ).pack(side="left")
         
         self.dims_entry = ctk.CTkEntry(
             dim_frame, placeholder_text="600x600", width=150,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=32, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.dims_entry.pack(side="left")
         self.dims_entry.insert(0, "600x600")
         
         ctk.CTkLabel(
-            dim_frame, text="  (e.g., 600x600 for passport)", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=11),
+            dim_frame, text="  (e.g., 600x600 for passport)", font=font(11),
             text_color=theme.TEXT_SECONDARY
         ).pack(side="left", padx=10)
         
@@ -125,20 +128,20 @@ class ResizeImagePanel(ctk.CTkFrame):
         size_frame.pack(fill="x", padx=20, pady=(0, 15))
         
         ctk.CTkLabel(
-            size_frame, text="Max File Size:", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=13),
+            size_frame, text="Max File Size:", font=font(13),
             text_color=theme.TEXT_PRIMARY, width=120, anchor="w"
         ).pack(side="left")
         
         self.size_entry = ctk.CTkEntry(
             size_frame, placeholder_text="50", width=80,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=32, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.size_entry.pack(side="left")
         
         ctk.CTkLabel(
             size_frame, text=" KB (optional, for passport photos)",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=11), text_color=theme.TEXT_SECONDARY
+            font=font(11), text_color=theme.TEXT_SECONDARY
         ).pack(side="left", padx=10)
         
         # Output
@@ -146,7 +149,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         output_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Output File", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output File", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -155,14 +158,14 @@ class ResizeImagePanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -170,7 +173,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         # Resize button
         self.resize_btn = ctk.CTkButton(
             self, text="📐 RESIZE IMAGE", command=self.resize_image,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
@@ -178,40 +181,51 @@ class ResizeImagePanel(ctk.CTkFrame):
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select an image to resize", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select an image to resize", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 15))
         
     def browse_input(self):
+        self.update_idletasks()
         file = filedialog.askopenfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Select image", filetypes=[("Image files", "*.jpg *.jpeg *.png"), ("All files", "*.*")]
         )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.input_file = file
             self.input_entry.delete(0, "end")
             self.input_entry.insert(0, file)
             
             # Auto-populate output
             if not self.output_file:
-                # Python 3.8 compatible replacement for with_stem
-                p = Path(file)
-                output = str(p.with_name(f"{p.stem}_resized{p.suffix}"))
+                root, ext = os.path.splitext(file)
+                output = f"{root}_resized{ext}"
                 self.output_entry.delete(0, "end")
                 self.output_entry.insert(0, output)
                 self.output_file = output
             
     def browse_output(self):
+        self.update_idletasks()
         file = filedialog.asksaveasfilename(
+            initialdir=self._last_dir or os.path.expanduser("~"),
             title="Save resized image as", defaultextension=".jpg",
             filetypes=[("JPEG", "*.jpg"), ("PNG", "*.png")]
         )
         if file:
+            self._last_dir = os.path.dirname(file)
             self.output_file = file
             self.output_entry.delete(0, "end")
             self.output_entry.insert(0, file)
             
+    def _sync_paths(self):
+        """Pick up paths typed or pasted into the entries since the last drop/browse"""
+        self.input_file = self.input_entry.get().strip()
+        self.output_file = self.output_entry.get().strip()
+        
     def resize_image(self):
+        self._sync_paths()
         if not self.input_file or not self.output_file:
             messagebox.showerror("Error", "Please select input and output files")
             return
@@ -225,7 +239,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         self.status_label.configure(text="Resizing image...", text_color=theme.INFO)
         
         size_kb = self.size_entry.get().strip()
-        threading.Thread(target=self._do_resize, args=(dims, size_kb)).start()
+        EXECUTOR.submit(self._do_resize, dims, size_kb)
         
     def _do_resize(self, dimensions, max_size_kb):
         try:
@@ -241,7 +255,7 @@ class ResizeImagePanel(ctk.CTkFrame):
         self.resize_btn.configure(state="normal", text="📐 RESIZE IMAGE")
         if success:
             self.status_label.configure(text=f"✓ Image resized successfully", text_color=theme.SUCCESS)
-            messagebox.showinfo("Success", f"Image resized!\n\nOutput: {self.output_file}")
+            toast.show(self, f"Image resized!\n\nOutput: {self.output_file}")
         else:
             self.status_label.configure(text="✗ Resize failed", text_color=theme.ERROR)
             
@@ -3,15 +3,19 @@ Security Panel - Add password protection or watermarks to PDFs
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
+from gui.worker import process_pool
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, parse_first_dropped_file
+
+
+# How often to check a job running in the process pool
+POLL_MS = 50
 
 class SecurityPanel(ctk.CTkFrame):
     """Panel for password protection and watermarking"""
@@ -24,6 +28,7 @@ class SecurityPanel(ctk.CTkFrame):
         self.mode = "password" # password or watermark
         self.input_file = ""
         self.output_file = ""
+        self._job = None  # Future of the running protect/watermark job
         
         self.create_widgets()
         
@@ -34,23 +39,22 @@ class SecurityPanel(ctk.CTkFrame):
     def drop_file(self, event):
         """Handle file drop event"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     self.input_file = file
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
                     
                     # Auto-set output
-                    p = Path(file)
+                    base, ext = os.path.splitext(file)
                     suffix = "_protected" if self.mode == "password" else "_watermarked"
-                    output = str(p.with_name(f"{p.stem}{suffix}{p.suffix}"))
+                    output = f"{base}{suffix}{ext}"
                     self.output_entry.delete(0, "end")
                     self.output_entry.insert(0, output)
                     self.output_file = output
                     
-                    self.status_label.configure(text=f"Selected: {p.name}", text_color=theme.INFO)
+                    self.status_label.configure(text=f"Selected: {os.path.basename(file)}", text_color=theme.INFO)
                 else:
                     self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
         except Exception as e:
@@ -59,13 +63,13 @@ class SecurityPanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="PDF Security", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="PDF Security", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Add password protection or watermark to PDFs",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Mode selection
@@ -73,7 +77,7 @@ class SecurityPanel(ctk.CTkFrame):
         mode_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            mode_frame, text="Security Type", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            mode_frame, text="Security Type", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -82,7 +86,7 @@ class SecurityPanel(ctk.CTkFrame):
         
         self.password_btn = ctk.CTkButton(
             btn_frame, text="🔒 Password Protection", command=lambda: self.set_mode("password"),
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             height=38, corner_radius=8
         )
@@ -90,7 +94,7 @@ class SecurityPanel(ctk.CTkFrame):
         
         self.watermark_btn = ctk.CTkButton(
             btn_frame, text="🏷️ Watermark", command=lambda: self.set_mode("watermark"),
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             fg_color=theme.BG_TERTIARY, hover_color=theme.get_accent_hover(),
             height=38, corner_radius=8
         )
@@ -101,7 +105,7 @@ class SecurityPanel(ctk.CTkFrame):
         input_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Input PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -110,14 +114,14 @@ class SecurityPanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose PDF...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -127,14 +131,14 @@ class SecurityPanel(ctk.CTkFrame):
         settings_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         self.settings_label = ctk.CTkLabel(
-            settings_frame, text="Password", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            settings_frame, text="Password", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         )
         self.settings_label.pack(fill="x", padx=20, pady=(15, 10))
         
         self.settings_entry = ctk.CTkEntry(
             settings_frame, placeholder_text="Enter password...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER, show="*"
         )
         self.settings_entry.pack(fill="x", padx=20, pady=(0, 15))
@@ -144,7 +148,7 @@ class SecurityPanel(ctk.CTkFrame):
         output_frame.grid(row=5, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Output File", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output File", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -153,14 +157,14 @@ class SecurityPanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output location...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -168,7 +172,7 @@ class SecurityPanel(ctk.CTkFrame):
         # Apply button
         self.apply_btn = ctk.CTkButton(
             self, text="🔒 APPLY PROTECTION", command=self.apply_security,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
@@ -176,7 +180,7 @@ class SecurityPanel(ctk.CTkFrame):
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select a PDF and enter password", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select a PDF and enter password", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=7, column=0, sticky="ew", padx=30, pady=(0, 15))
@@ -205,9 +209,8 @@ class SecurityPanel(ctk.CTkFrame):
             
             if not self.output_file:
                 suffix = "_protected" if self.mode == "password" else "_watermarked"
-                # Python 3.8 compatible replacement for with_stem
-                p = Path(file)
-                output = str(p.with_name(f"{p.stem}{suffix}{p.suffix}"))
+                base, ext = os.path.splitext(file)
+                output = f"{base}{suffix}{ext}"
                 self.output_entry.delete(0, "end")
                 self.output_entry.insert(0, output)
                 self.output_file = output
@@ -222,6 +225,8 @@ class SecurityPanel(ctk.CTkFrame):
             self.output_entry.insert(0, file)
             
     def apply_security(self):
+        if self._job is not None and not self._job.done():
+            return
         if not self.input_file or not self.output_file:
             messagebox.showerror("Error", "Please select input and output files")
             return
@@ -235,17 +240,24 @@ class SecurityPanel(ctk.CTkFrame):
         self.apply_btn.configure(state="disabled", text="Applying...")
         self.status_label.configure(text="Processing...", text_color=theme.INFO)
         
-        threading.Thread(target=self._do_apply, args=(value,)).start()
+        # Run in a separate process: encryption and watermarking hold the GIL
+        # for most of their run and would otherwise stall the Tk loop
+        if self.mode == "password":
+            self._job = process_pool().submit(Controller.add_password, self.input_file, self.output_file, value)
+        else:
+            self._job = process_pool().submit(Controller.add_watermark, self.input_file, self.output_file, value)
+        self.after(POLL_MS, self._poll, self._job)
         
-    def _do_apply(self, value):
+    def _poll(self, fut):
+        if not fut.done():
+            self.after(POLL_MS, self._poll, fut)
+            return
         try:
-            if self.mode == "password":
-                success = Controller.add_password(self.input_file, self.output_file, value)
-            else:
-                success = Controller.add_watermark(self.input_file, self.output_file, value)
-            self.after(0, self._complete, success)
+            success = fut.result()
         except Exception as e:
-            self.after(0, self._error, str(e))
+            self._error(str(e))
+            return
+        self._complete(success)
             
     def _complete(self, success):
         self.apply_btn.configure(state="normal", text="🔒 APPLY PROTECTION" if self.mode == "password" else "🏷️ ADD WATERMARK")
@@ -3,15 +3,23 @@ Split Panel - GUI for splitting PDFs
 """
 
 import customtkinter as ctk
-from pathlib import Path
+import os
+import re
 from tkinter import filedialog, messagebox
-import threading
 
-from gui.theme import theme
+from gui.theme import theme, font
+from gui.worker import process_pool
 from pdf_wizard.controller import Controller
 
 
-from gui.dnd import parse_dropped_files
+from gui.dnd import PDF_EXTS, parse_first_dropped_file
+
+
+# One range token as the engine accepts it: "10", "1-5" or "9-end"
+_RANGE_RE = re.compile(r"\A(\d+)(?:\s*-\s*(\d+|end))?\Z", re.IGNORECASE)
+
+# How often to check a job running in the process pool
+POLL_MS = 50
 
 class SplitPanel(ctk.CTkFrame):
     """Panel for splitting PDFs"""
@@ -23,6 +31,7 @@ class SplitPanel(ctk.CTkFrame):
         self.input_file = ""
         self.output_dir = ""
         self.split_mode = ctk.StringVar(value="pages")
+        self._job = None  # Future of the running split job
         
         self.create_widgets()
         
@@ -33,23 +42,20 @@ class SplitPanel(ctk.CTkFrame):
     def drop_file(self, event):
         """Handle file drop event"""
         try:
-            files = parse_dropped_files(event.data)
-            if files:
-                file = files[0]
-                if file.lower().endswith('.pdf'):
+            file = parse_first_dropped_file(event.data)
+            if file:
+                if os.path.splitext(file)[1].lower() in PDF_EXTS:
                     self.input_file = file
                     self.input_entry.delete(0, "end")
                     self.input_entry.insert(0, file)
                     
                     # Auto-set output dir
-                    p = Path(file)
-                    folder_name = f"{p.stem}_split"
-                    output_dir = str(p.parent / folder_name)
+                    output_dir = f"{os.path.splitext(file)[0]}_split"
                     self.output_dir = output_dir
                     self.output_entry.delete(0, "end")
                     self.output_entry.insert(0, output_dir)
                     
-                    self.status_label.configure(text=f"Selected: {p.name}", text_color=theme.INFO)
+                    self.status_label.configure(text=f"Selected: {os.path.basename(file)}", text_color=theme.INFO)
                 else:
                     self.status_label.configure(text="Please drop a PDF file", text_color=theme.WARNING)
         except Exception as e:
@@ -58,13 +64,13 @@ class SplitPanel(ctk.CTkFrame):
     def create_widgets(self):
         # Header
         ctk.CTkLabel(
-            self, text="Split PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=28, weight="bold"),
+            self, text="Split PDF", font=font(28, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).grid(row=0, column=0, sticky="ew", padx=30, pady=(30, 5))
         
         ctk.CTkLabel(
             self, text="Split PDF into individual pages or page ranges",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14), text_color=theme.TEXT_SECONDARY, anchor="w"
+            font=font(14), text_color=theme.TEXT_SECONDARY, anchor="w"
         ).grid(row=1, column=0, sticky="ew", padx=30, pady=(0, 20))
         
         # Input
@@ -72,7 +78,7 @@ class SplitPanel(ctk.CTkFrame):
         input_frame.grid(row=2, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            input_frame, text="Input PDF", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            input_frame, text="Input PDF", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -81,14 +87,14 @@ class SplitPanel(ctk.CTkFrame):
         
         self.input_entry = ctk.CTkEntry(
             path_frame, placeholder_text="Choose PDF to split...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.input_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             path_frame, text="📁", command=self.browse_input,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -98,7 +104,7 @@ class SplitPanel(ctk.CTkFrame):
         settings_frame.grid(row=3, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            settings_frame, text="Split Mode", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            settings_frame, text="Split Mode", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -108,14 +114,14 @@ class SplitPanel(ctk.CTkFrame):
         
         ctk.CTkRadioButton(
             radio_frame, text="Split One Page Per File", variable=self.split_mode, value="pages",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             text_color=theme.TEXT_PRIMARY, hover_color=theme.get_accent(), fg_color=theme.get_accent(),
             command=self.toggle_range_input
         ).pack(anchor="w", pady=(0, 10))
         
         ctk.CTkRadioButton(
             radio_frame, text="Custom Page Ranges", variable=self.split_mode, value="ranges",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             text_color=theme.TEXT_PRIMARY, hover_color=theme.get_accent(), fg_color=theme.get_accent(),
             command=self.toggle_range_input
         ).pack(anchor="w")
@@ -125,13 +131,13 @@ class SplitPanel(ctk.CTkFrame):
         # Don't pack initially
         
         ctk.CTkLabel(
-            self.range_input_frame, text="Ranges (e.g., 1-4, 5-8):", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self.range_input_frame, text="Ranges (e.g., 1-4, 5-8):", font=font(12),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(side="left", padx=(0, 10))
         
         self.range_entry = ctk.CTkEntry(
             self.range_input_frame, placeholder_text="1-4, 5-8, 9-end",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=200, height=32, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.range_entry.pack(side="left", fill="x", expand=True)
@@ -141,7 +147,7 @@ class SplitPanel(ctk.CTkFrame):
         output_frame.grid(row=4, column=0, sticky="ew", padx=30, pady=(0, 15))
         
         ctk.CTkLabel(
-            output_frame, text="Output Directory", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=14, weight="bold"),
+            output_frame, text="Output Directory", font=font(14, "bold"),
             text_color=theme.TEXT_PRIMARY, anchor="w"
         ).pack(fill="x", padx=20, pady=(15, 10))
         
@@ -150,14 +156,14 @@ class SplitPanel(ctk.CTkFrame):
         
         self.output_entry = ctk.CTkEntry(
             output_path_frame, placeholder_text="Choose output folder...",
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             height=35, fg_color=theme.BG_TERTIARY, border_color=theme.BORDER
         )
         self.output_entry.pack(side="left", fill="x", expand=True, padx=(0, 10))
         
         ctk.CTkButton(
             output_path_frame, text="📁", command=self.browse_output,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY, size=13),
+            font=font(13),
             width=50, height=35, fg_color=theme.BG_TERTIARY,
             hover_color=theme.BG_SIDEBAR, corner_radius=8
         ).pack(side="left")
@@ -165,7 +171,7 @@ class SplitPanel(ctk.CTkFrame):
         # Split button
         self.split_btn = ctk.CTkButton(
             self, text="✂️ SPLIT PDF", command=self.split_pdf,
-            font=ctk.CTkFont(family=theme.FONT_FAMILY,size=15, weight="bold"), height=45,
+            font=font(15, "bold"), height=45,
             fg_color=theme.get_accent(), hover_color=theme.get_accent_hover(),
             corner_radius=10
         )
@@ -173,7 +179,7 @@ class SplitPanel(ctk.CTkFrame):
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="Select a PDF to split", font=ctk.CTkFont(family=theme.FONT_FAMILY,size=12),
+            self, text="Select a PDF to split", font=font(12),
             text_color=theme.TEXT_SECONDARY
         )
         self.status_label.grid(row=6, column=0, sticky="ew", padx=30, pady=(0, 15))
@@ -193,7 +199,7 @@ class SplitPanel(ctk.CTkFrame):
             
             # Auto-populate output dir if empty
             if not self.output_dir:
-                output_dir = str(Path(file).parent)
+                output_dir = os.path.dirname(file)
                 self.output_entry.delete(0, "end")
                 self.output_entry.insert(0, output_dir)
                 self.output_dir = output_dir
@@ -206,6 +212,8 @@ class SplitPanel(ctk.CTkFrame):
             self.output_entry.insert(0, folder)
             
     def split_pdf(self):
+        if self._job is not None and not self._job.done():
+            return
         if not self.input_file or not self.output_dir:
             messagebox.showerror("Error", "Please select input PDF and output directory")
             return
@@ -218,23 +226,38 @@ class SplitPanel(ctk.CTkFrame):
             if not range_str:
                 messagebox.showerror("Error", "Please enter page ranges")
                 return
-            # Controller.split_pdf parses the string if passed as list of strings?
-            # Actually, let's pass a list of strings as Controller expects split string
-            # wait, CLI does ranges.split(','), so it passes ['1-4', '5-8'] to Controller
-            # Controller.split_pdf(..., ranges: List[str])
-            ranges = [r.strip() for r in range_str.split(',')]
+            # Validate and normalise each range here so bad input fails before
+            # the job starts; the engine still takes strings like '1-4'
+            ranges = []
+            for token in range_str.split(','):
+                token = token.strip()
+                match = _RANGE_RE.match(token)
+                if match:
+                    start = int(match.group(1))
+                    # 'end' is resolved by the engine once it knows the page count
+                    end = match.group(2).lower() if match.group(2) else str(start)
+                if not match or start < 1 or (end != "end" and start > int(end)):
+                    messagebox.showerror("Error", f"Invalid page range: '{token}'\n\nUse pages or ranges like 1-4, 5-8, 9-end")
+                    return
+                ranges.append(f"{start}-{end}" if match.group(2) else str(start))
             
         self.split_btn.configure(state="disabled", text="Splitting...")
         self.status_label.configure(text="Splitting PDF...", text_color=theme.INFO)
         
-        threading.Thread(target=self._do_split, args=(mode, ranges)).start()
+        # Run in a separate process so page copying doesn't hold our GIL
+        self._job = process_pool().submit(Controller.split_pdf, self.input_file, self.output_dir, mode, ranges)
+        self.after(POLL_MS, self._poll, self._job)
         
-    def _do_split(self, mode, ranges):
+    def _poll(self, fut):
+        if not fut.done():
+            self.after(POLL_MS, self._poll, fut)
+            return
         try:
-            success = Controller.split_pdf(self.input_file, self.output_dir, mode, ranges)
-            self.after(0, self._complete, success)
+            success = fut.result()
         except Exception as e:
-            self.after(0, self._error, str(e))
+            self._error(str(e))
+            return
+        self._complete(success)
             
     def _complete(self, success):
         self.split_btn.configure(state="normal", text="✂️ SPLIT PDF")
@@ -4,9 +4,15 @@ PDF Wizard GUI - Theme System with Windows Accent Colors
 Provides dark theme with Windows accent color integration
 """
 
-import winreg
+import sys
+from functools import lru_cache
 from typing import Tuple
 
+import customtkinter as ctk
+
+# Used when the Windows accent colour can't be read (or off Windows)
+_FALLBACK_ACCENT = "#e91e63"
+
 class PDFWizardTheme:
     """Theme configuration for PDF Wizard GUI"""
     
@@ -15,23 +21,26 @@ class PDFWizardTheme:
         self.accent_hover = self.lighten_color(self.accent_color, 20)
         
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_windows_accent_color() -> str:
-        """Get Windows 10/11 accent color from registry"""
+        """Get Windows 10/11 accent color from registry (read once per process)"""
+        if sys.platform != "win32":
+            return _FALLBACK_ACCENT
         try:
+            import winreg
+            
             registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
             key = winreg.OpenKey(registry, r'SOFTWARE\Microsoft\Windows\DWM')
             accent_color_dword = winreg.QueryValueEx(key, 'AccentColor')[0]
             winreg.CloseKey(key)
             
-            # Convert DWORD to RGB (format: 0xAABBGGRR)
-            r = (accent_color_dword >> 0) & 0xff
-            g = (accent_color_dword >> 8) & 0xff
-            b = (accent_color_dword >> 16) & 0xff
+            # Convert DWORD to RGB (format: 0xAABBGGRR - little-endian bytes are R, G, B, A)
+            r, g, b = accent_color_dword.to_bytes(4, 'little')[:3]
             
             return f"#{r:02x}{g:02x}{b:02x}"
         except Exception:
             # Fallback to pink if can't read registry
-            return "#e91e63"
+            return _FALLBACK_ACCENT
     
     @staticmethod
     def lighten_color(hex_color: str, percent: int) -> str:
@@ -82,7 +91,14 @@ class PDFWizardTheme:
 theme = PDFWizardTheme()
 
 
+@lru_cache(maxsize=None)
+def font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get a shared theme font (one CTkFont per size/weight instead of one per widget)"""
+    return ctk.CTkFont(family=theme.FONT_FAMILY, size=size, weight=weight)
+
+
 # CustomTkinter color configuration
+_accent, _accent_hover = theme.accent_color, theme.accent_hover
 CTK_THEME = {
     "CTk": {
         "fg_color": [theme.BG_PRIMARY, theme.BG_PRIMARY]
@@ -92,10 +108,10 @@ CTK_THEME = {
         "border_color": [theme.BORDER, theme.BORDER]
     },
     "CTkButton": {
-        "fg_color": [theme.get_accent(), theme.get_accent()],
-        "hover_color": [theme.get_accent_hover(), theme.get_accent_hover()],
+        "fg_color": [_accent, _accent],
+        "hover_color": [_accent_hover, _accent_hover],
         "text_color": [theme.TEXT_PRIMARY, theme.TEXT_PRIMARY],
-        "border_color": [theme.get_accent(), theme.get_accent()]
+        "border_color": [_accent, _accent]
     },
     "CTkLabel": {
         "text_color": [theme.TEXT_PRIMARY, theme.TEXT_PRIMARY]
@@ -111,18 +127,18 @@ CTK_THEME = {
         "border_color": [theme.BORDER, theme.BORDER]
     },
     "CTkSwitch": {
-        "progress_color": [theme.get_accent(), theme.get_accent()],
+        "progress_color": [_accent, _accent],
         "button_color": [theme.TEXT_PRIMARY, theme.TEXT_PRIMARY],
         "button_hover_color": [theme.BG_TERTIARY, theme.BG_TERTIARY]
     },
     "CTkProgressBar": {
-        "progress_color": [theme.get_accent(), theme.get_accent()],
+        "progress_color": [_accent, _accent],
         "fg_color": [theme.BG_TERTIARY, theme.BG_TERTIARY]
     },
     "CTkOptionMenu": {
         "fg_color": [theme.BG_TERTIARY, theme.BG_TERTIARY],
         "button_color": [theme.BG_TERTIARY, theme.BG_TERTIARY],
-        "button_hover_color": [theme.get_accent(), theme.get_accent()],
+        "button_hover_color": [_accent, _accent],
         "text_color": [theme.TEXT_PRIMARY, theme.TEXT_PRIMARY]
     }
 }
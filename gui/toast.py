@@ -0,0 +1,38 @@
+"""
+PDF Wizard GUI - Toast notifications
+
+Self-dismissing popups for success messages, so a finished job doesn't
+block the window behind a modal dialog. Errors still use messagebox.
+"""
+
+import customtkinter as ctk
+
+from gui.theme import theme, font
+
+
+def show(widget, message, duration=2500):
+    """Show a toast at the bottom of widget's window and close it after duration ms"""
+    root = widget.winfo_toplevel()
+    
+    toast = ctk.CTkToplevel(root)
+    toast.overrideredirect(True)
+    toast.attributes("-topmost", True)
+    
+    frame = ctk.CTkFrame(
+        toast, fg_color=theme.BG_SECONDARY, border_color=theme.SUCCESS,
+        border_width=2, corner_radius=10
+    )
+    frame.pack(fill="both", expand=True)
+    ctk.CTkLabel(
+        frame, text=message, font=font(13),
+        text_color=theme.TEXT_PRIMARY, justify="left"
+    ).pack(padx=20, pady=12)
+    
+    # Centre horizontally, just above the bottom edge of the main window
+    toast.update_idletasks()
+    x = root.winfo_rootx() + (root.winfo_width() - toast.winfo_reqwidth()) // 2
+    y = root.winfo_rooty() + root.winfo_height() - toast.winfo_reqheight() - 40
+    toast.geometry(f"+{x}+{y}")
+    
+    toast.after(duration, toast.destroy)
+    return toast
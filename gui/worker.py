@@ -0,0 +1,65 @@
+"""
+PDF Wizard GUI - Shared background worker pools
+
+Panels submit long-running jobs here instead of starting a new thread per click,
+then report back to Tk with self.after(0, ...).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdfwiz")
+
+# Quick UI-side work (drop validation, previews) gets its own worker so it
+# never queues behind a long job on EXECUTOR
+UI_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdfwiz-ui")
+
+# Start a worker now so the first click doesn't pay for thread creation
+EXECUTOR.submit(int)
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def process_pool():
+    """Return the shared process pool, creating it on first use
+
+    For jobs that hold the GIL for most of their run (PyPDF2 encryption,
+    PyMuPDF page edits). Only picklable arguments - paths and strings - may be
+    submitted. Created lazily so opening the GUI doesn't spawn interpreters.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=2)
+        return _process_pool
+
+
+def _cancel_pending(executor):
+    """Stop executor without waiting, dropping jobs that haven't started"""
+    try:
+        executor.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # Python 3.8 has no cancel_futures
+        executor.shutdown(wait=False)
+
+
+def shutdown():
+    """Stop both pools when the main window closes
+
+    Queued jobs are cancelled and the process pool's workers are terminated, so
+    closing mid-encryption or mid-split doesn't keep the app alive. A job already
+    running on a worker thread can't be interrupted and still finishes before
+    the interpreter exits.
+    """
+    _cancel_pending(EXECUTOR)
+    _cancel_pending(UI_EXECUTOR)
+    with _process_pool_lock:
+        pool = _process_pool
+    if pool is None:
+        return
+    # Grab the workers first - shutdown() forgets them
+    processes = list((getattr(pool, "_processes", None) or {}).values())
+    _cancel_pending(pool)
+    for process in processes:
+        process.terminate()
@@ -55,7 +55,7 @@ def merge(input_files, output):
 @click.option('-o', '--output-dir', required=True, help='Output directory for split files')
 @click.option('--mode', type=click.Choice(['pages', 'ranges']), default='pages',
               help='Split mode: pages (one file per page) or ranges (custom ranges)')
-@click.option('--ranges', help='Page ranges for split (e.g., "1-5,6-10,11-15")')
+@click.option('--ranges', help='Page ranges for split (e.g., "1-5,6-10,11-end")')
 def split(input_file, output_dir, mode, ranges):
     """
     Split a PDF into multiple files
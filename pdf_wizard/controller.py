@@ -6,14 +6,19 @@ Handles common preprocessing, error handling, and output management.
 """
 
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 
-from pdf_wizard.engine import merger, security, metadata, compressor, image_processor, academic
 from pdf_wizard.utils import (
     error, warning, info, success,
     validate_file_exists, validate_directory_exists
 )
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Engine modules pull in fitz/PyPDF2/PIL, so each method imports the one it
+# needs on first use; importing Controller stays cheap for the GUI.
+
 
 class Controller:
     """Central dispatcher for PDF operations"""
@@ -22,6 +27,7 @@ class Controller:
     def merge_pdfs(input_files: List[str], output: str) -> bool:
         """Merge multiple PDFs"""
         try:
+            from pdf_wizard.engine import merger
             # Validate inputs
             pdf_paths = [validate_file_exists(f, '.pdf') for f in input_files]
             output_path = Path(output)
@@ -37,6 +43,7 @@ class Controller:
     def split_pdf(input_file: str, output_dir: str, mode: str = 'pages', ranges: Optional[List[str]] = None) -> bool:
         """Split PDF into multiple files"""
         try:
+            from pdf_wizard.engine import merger
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = validate_directory_exists(output_dir, create_if_missing=True)
             
@@ -51,6 +58,7 @@ class Controller:
     def protect_pdf(input_file: str, output: str, password: str, owner_password: Optional[str] = None) -> bool:
         """Add password protection to PDF"""
         try:
+            from pdf_wizard.engine import security
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -67,6 +75,7 @@ class Controller:
     def watermark_pdf(input_file: str, watermark: str, output: str) -> bool:
         """Add watermark to PDF"""
         try:
+            from pdf_wizard.engine import security
             pdf_path = validate_file_exists(input_file, '.pdf')
             watermark_path = validate_file_exists(watermark, '.pdf')
             output_path = Path(output)
@@ -84,6 +93,7 @@ class Controller:
     def compress_pdf(input_file: str, output: str, target_size: float, quality: str = 'medium') -> bool:
         """Compress PDF to target size"""
         try:
+            from pdf_wizard.engine import compressor
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -100,6 +110,7 @@ class Controller:
     def strip_metadata_pdf(input_file: str, output: str) -> bool:
         """Strip metadata from PDF"""
         try:
+            from pdf_wizard.engine import metadata
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -114,6 +125,7 @@ class Controller:
     def view_metadata_pdf(input_file: str) -> bool:
         """View PDF metadata"""
         try:
+            from pdf_wizard.engine import metadata
             pdf_path = validate_file_exists(input_file, '.pdf')
             metadata.display_metadata(pdf_path)
             return True
@@ -132,6 +144,7 @@ class Controller:
     ) -> bool:
         """Resize and compress image"""
         try:
+            from pdf_wizard.engine import image_processor
             img_path = validate_file_exists(input_file)
             output_path = Path(output)
             
@@ -139,7 +152,7 @@ class Controller:
             dim_tuple = None
             if dimensions:
                 try:
-                    w, h = map(int, dimensions.split('x'))
+                    w, h = map(int, dimensions.lower().split('x'))
                     dim_tuple = (w, h)
                 except:
                     error(f"Invalid dimensions format: {dimensions}. Use format like '600x600'")
@@ -158,6 +171,7 @@ class Controller:
     def image_to_pdf_convert(image_files: List[str], output: str) -> bool:
         """Convert images to PDF"""
         try:
+            from pdf_wizard.engine import image_processor
             img_paths = [validate_file_exists(f) for f in image_files]
             output_path = Path(output)
             
@@ -172,6 +186,7 @@ class Controller:
     def pdf_to_images_convert(input_file: str, output_dir: str, format: str = 'PNG', dpi: int = 300) -> bool:
         """Extract PDF pages as images"""
         try:
+            from pdf_wizard.engine import image_processor
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = validate_directory_exists(output_dir, create_if_missing=True)
             
@@ -182,10 +197,22 @@ class Controller:
             error(str(e))
             return False
     
+    @staticmethod
+    def pdf_page_preview(input_file: str, scale: float = 0.25) -> Optional["Image.Image"]:
+        """Render a low-resolution thumbnail of the first page for GUI previews"""
+        try:
+            from pdf_wizard.engine import image_processor
+            pdf_path = validate_file_exists(input_file, '.pdf')
+            return image_processor.render_page_preview(pdf_path, 0, scale)
+        except Exception as e:
+            error(str(e))
+            return None
+    
     @staticmethod
     def remove_blank_pages_pdf(input_file: str, output: str, threshold: float = 0.98) -> bool:
         """Remove blank pages from scanned PDF"""
         try:
+            from pdf_wizard.engine import academic
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -200,6 +227,7 @@ class Controller:
     def auto_rotate_pdf(input_file: str, output: str) -> bool:
         """Auto-rotate pages to correct orientation"""
         try:
+            from pdf_wizard.engine import academic
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -214,6 +242,7 @@ class Controller:
     def reorder_pdf_pages(input_file: str, output: str, order: str) -> bool:
         """Reorder PDF pages"""
         try:
+            from pdf_wizard.engine import academic
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -228,6 +257,7 @@ class Controller:
     def generate_qr_code(input_file: str, output: str) -> bool:
         """Generate QR code for document verification"""
         try:
+            from pdf_wizard.engine import academic
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -242,6 +272,7 @@ class Controller:
     def compare_pdfs_files(original: str, modified: str, output: str) -> bool:
         """Compare two PDFs"""
         try:
+            from pdf_wizard.engine import academic
             orig_path = validate_file_exists(original, '.pdf')
             mod_path = validate_file_exists(modified, '.pdf')
             output_path = Path(output)
@@ -263,6 +294,7 @@ class Controller:
     ) -> bool:
         """Add page numbers to PDF"""
         try:
+            from pdf_wizard.engine import academic
             pdf_path = validate_file_exists(input_file, '.pdf')
             output_path = Path(output)
             
@@ -311,6 +343,7 @@ class Controller:
     def view_metadata(input_file: str) -> Optional[str]:
         """View metadata and return formatted string for GUI"""
         try:
+            from pdf_wizard.engine import metadata
             pdf_path = validate_file_exists(input_file, '.pdf')
             data = metadata.view_metadata(pdf_path)
             
@@ -345,22 +378,18 @@ class Controller:
         return Controller.resize_image_file(input_file, output, max_size_kb, dimensions)
 
     @staticmethod
-    def compress_image(input_file: str, output: str, target_size_kb: int, quality: int = 85) -> bool:
-        """Compress image for GUI"""
+    def compress_image(input_file: str, output: str, target_size_kb: int, quality: int = 85,
+                       on_progress: Optional[Callable[[float], None]] = None) -> bool:
+        """Compress image for GUI (on_progress receives the completed fraction per probe)"""
         try:
+            from pdf_wizard.engine import image_processor
             img_path = validate_file_exists(input_file)
             output_path = Path(output)
             
-            # Simple wrapper around engine function if it exists, or image_processor
-            # image_processor.compress_image signature: (input_path, output_path, target_size_kb, preserve_transparency)
-            # It doesn't seem to take quality directly in cli call, but let's check engine
-            # CLI calls: comp_img(img_path, output_path, target_size, preserve_transparency)
-            # GUI calls: compress_image(input, output, target_kb, quality)
-            # The engine might not support quality param in compress_image if it optimizes for size.
-            # Let's map to existing engine function.
-            
+            # The engine binary-searches JPEG quality up to the requested quality
             success_flag, error_msg = image_processor.compress_image(
-                img_path, output_path, target_size_kb
+                img_path, output_path, target_size_kb, max_quality=quality,
+                on_progress=on_progress
             )
             return success_flag
         except Exception as e:
@@ -373,9 +402,9 @@ class Controller:
         return Controller.image_to_pdf_convert(image_files, output)
 
     @staticmethod
-    def pdf_to_images(input_file: str, output_dir: str) -> bool:
+    def pdf_to_images(input_file: str, output_dir: str, format: str = 'PNG', dpi: int = 300) -> bool:
         """Alias for pdf_to_images_convert"""
-        return Controller.pdf_to_images_convert(input_file, output_dir)
+        return Controller.pdf_to_images_convert(input_file, output_dir, format, dpi)
 
     @staticmethod
     def remove_blank_pages(input_file: str, output: str) -> bool:
@@ -13,10 +13,11 @@ Innovative features designed specifically for academic document workflows:
 from pathlib import Path
 from typing import Optional, Tuple, List
 import fitz  # PyMuPDF
-from PIL import Image
+from PIL import Image, ImageChops
 import qrcode
 import hashlib
 import io
+import threading
 
 from pdf_wizard.utils import (
     success, error, warning, info,
@@ -26,39 +27,37 @@ from pdf_wizard.utils import (
 
 import concurrent.futures
 import os
+import shutil
 
-def _scan_page_brightness(args):
-    """Scan a single page for brightness to detect blanks"""
-    input_file_path, page_num, threshold = args
+def _page_is_blank(page, threshold):
+    """Check whether a page renders bright enough to count as blank"""
+    pix = page.get_pixmap(alpha=False)
+    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    pix = None
     
-    # Each thread/process opens the file
-    doc = fitz.open(str(input_file_path))
-    page = doc[page_num]
-    pix = page.get_pixmap()
-    
-    img_data = pix.samples
-    total_pixels = pix.width * pix.height
-    
-    # Calculate bright pixels (simplified)
-    # Checking every 3rd byte (RGB) is slow in python, so we sample steps to be faster
-    step = 3 * 10  # Sample every 10th pixel for speed
-    bright_pixels = 0
-    sampled_pixels = 0
-    
-    for i in range(0, len(img_data), step):
-        if i+2 < len(img_data):
-            if img_data[i] > 240 and img_data[i+1] > 240 and img_data[i+2] > 240:
-                bright_pixels += 1
-            sampled_pixels += 1
-            
-    doc.close()
-    
-    if sampled_pixels == 0: return False
+    # A pixel is bright when all three channels are > 240, i.e. its darkest
+    # channel is; reduce to that channel and count it from the histogram (all in C)
+    r, g, b = img.split()
+    darkest = ImageChops.darker(ImageChops.darker(r, g), b)
+    total_pixels = img.width * img.height
+    if total_pixels == 0: return False
     
-    whiteness = bright_pixels / sampled_pixels
+    whiteness = sum(darkest.histogram()[241:]) / total_pixels
     return whiteness >= threshold
 
 
+def _scan_page_chunk(args):
+    """Scan a block of pages for blanks, returning their zero-based numbers"""
+    input_file_path, page_indices, threshold = args
+    
+    # Each process opens the file once for its whole block
+    doc = fitz.open(str(input_file_path))
+    try:
+        return [page_num for page_num in page_indices if _page_is_blank(doc[page_num], threshold)]
+    finally:
+        doc.close()
+
+
 def remove_blank_pages(
     input_file: Path,
     output_file: Path,
@@ -75,22 +74,33 @@ def remove_blank_pages(
         total_pages = len(doc)
         doc.close()
         
-        blank_pages = []
+        blank_pages = set()
         
         if show_progress:
             progress = create_progress_bar(total_pages, "Scanning pages (Parallel)")
-            
-        tasks = [(input_file, i, threshold) for i in range(total_pages)]
         
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            # map maintains order so we know which result corresponds to which page (0...N)
-            results = list(executor.map(_scan_page_brightness, tasks))
-            
-            for i, is_blank in enumerate(results):
-                if is_blank:
-                    blank_pages.append(i + 1)
+        # Contiguous blocks, one per worker, so each process opens the PDF once
+        num_workers = max(1, min(os.cpu_count() or 4, total_pages))
+        chunk_size = max(1, -(-total_pages // num_workers))
+        tasks = [
+            (input_file, range(i, min(i + chunk_size, total_pages)), threshold)
+            for i in range(0, total_pages, chunk_size)
+        ]
+        
+        if len(tasks) <= 1:
+            # Not worth starting a pool for a single block
+            for task in tasks:
+                blank_pages.update(_scan_page_chunk(task))
                 if show_progress:
-                    progress.update(1)
+                    progress.update(len(task[1]))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {executor.submit(_scan_page_chunk, task): len(task[1]) for task in tasks}
+                
+                for future in concurrent.futures.as_completed(futures):
+                    blank_pages.update(future.result())
+                    if show_progress:
+                        progress.update(futures[future])
                     
         if show_progress:
             progress.close()
@@ -103,14 +113,14 @@ def remove_blank_pages(
             success(f"PDF saved (no changes needed) → {output_file.name}")
             return True, None
         
-        info(f"Found {len(blank_pages)} blank pages: {blank_pages}")
+        info(f"Found {len(blank_pages)} blank pages: {sorted(p + 1 for p in blank_pages)}")
         
         # Create new PDF without blank pages - this part is fast enough to do sequentially
         doc = fitz.open(str(input_file))
         output_doc = fitz.open()
         
         for page_num in range(total_pages):
-            if (page_num + 1) not in blank_pages:
+            if page_num not in blank_pages:
                 output_doc.insert_pdf(doc, from_page=page_num, to_page=page_num)
         
         output_doc.save(str(output_file))
@@ -259,6 +269,44 @@ def reorder_pages(
         return False, error_msg
 
 
+# One QRCode reused across calls (rebuilt data each time); guarded for GUI worker threads
+_QR = None
+_qr_lock = threading.Lock()
+
+
+def _get_qr() -> qrcode.QRCode:
+    """Return the shared QRCode encoder, creating it on first use"""
+    global _QR
+    if _QR is None:
+        _QR = qrcode.QRCode(
+            version=1,
+            error_correction=qrcode.constants.ERROR_CORRECT_L,
+            box_size=10,
+            border=4,
+        )
+    return _QR
+
+
+def _file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 hex digest of the raw file bytes (no PDF parsing)"""
+    with open(path, 'rb') as f:
+        # Python 3.11+ runs the read/update loop in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
+
+def _same_file_contents(path1: Path, path2: Path) -> bool:
+    """Cheap size check first, then compare content hashes"""
+    if os.path.getsize(path1) != os.path.getsize(path2):
+        return False
+    return _file_sha256(path1) == _file_sha256(path2)
+
+
 def generate_qr_share(
     input_file: Path,
     output_png: Path
@@ -278,28 +326,20 @@ def generate_qr_share(
         info(f"Generating verification QR code for {input_file.name}...")
         
         # Calculate SHA-256 hash of the PDF
-        sha256_hash = hashlib.sha256()
-        
-        with open(input_file, 'rb') as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        
-        file_hash = sha256_hash.hexdigest()
+        file_hash = _file_sha256(input_file)
         
         # Create verification string
         verification_data = f"File: {input_file.name}\nSHA-256: {file_hash[:32]}..."
         
         # Generate QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(file_hash)
-        qr.make(fit=True)
-        
-        img = qr.make_image(fill_color="black", back_color="white")
+        with _qr_lock:
+            qr = _get_qr()
+            qr.clear()
+            qr.version = 1  # best_fit starts from here - don't inherit the last fit
+            qr.add_data(file_hash)
+            qr.make(fit=True)
+            
+            img = qr.make_image(fill_color="black", back_color="white")
         img.save(output_png)
         
         success(f"QR code generated → {output_png.name}")
@@ -334,6 +374,20 @@ def compare_pdfs(
     try:
         info(f"Comparing {original_file.name} with {modified_file.name}...")
         
+        summary_path = output_file.with_name(f"{output_file.stem}_report.txt")
+        
+        # Byte-identical inputs need no page-by-page diff - the report is an
+        # unmarked copy, as it would be after a diff that found nothing
+        if _same_file_contents(original_file, modified_file):
+            if modified_file.resolve() != output_file.resolve():
+                shutil.copyfile(modified_file, output_file)
+            with open(summary_path, 'w') as f:
+                f.write(f"Comparison Report for {original_file.name} vs {modified_file.name}\n")
+                f.write("="*50 + "\n\n")
+                f.write("Files are byte-for-byte identical.\n")
+            success(f"Files are identical. Saved copy to {output_file.name}")
+            return True, None
+        
         doc1 = fitz.open(str(original_file))
         doc2 = fitz.open(str(modified_file))
         
@@ -382,7 +436,6 @@ def compare_pdfs(
         doc2.close()
         
         # Generate a text summary file next to the PDF
-        summary_path = output_file.with_name(f"{output_file.stem}_report.txt")
         with open(summary_path, 'w') as f:
             f.write(f"Comparison Report for {original_file.name} vs {modified_file.name}\n")
             f.write("="*50 + "\n\n")
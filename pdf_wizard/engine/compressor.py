@@ -14,6 +14,7 @@ from typing import Optional, Tuple
 import fitz  # PyMuPDF
 from PIL import Image
 import io
+import shutil
 
 from pdf_wizard.utils import (
     success, error, warning, info,
@@ -148,8 +149,11 @@ def compress_pdf(
         info(f"Compressing {input_file.name} ({format_file_size(get_file_size(input_file))}) to ≤{target_size_mb} MB...")
         
         if original_size <= target_size_mb:
-            warning(f"File is already under target size ({original_size:.2f} MB ≤ {target_size_mb} MB)")
-            info("Performing light compression anyway...")
+            # Nothing to gain from a full compression pass - keep the original bytes
+            if input_file.resolve() != output_file.resolve():
+                shutil.copy2(input_file, output_file)
+            success(f"File is already under target size ({original_size:.2f} MB ≤ {target_size_mb} MB), copied unchanged")
+            return True, None
         
         # Quality presets
         quality_settings = {
@@ -215,7 +219,6 @@ def compress_pdf(
             info("Using original file instead...")
             
             # Copy original to output
-            import shutil
             shutil.copy2(input_file, output_file)
             
             final_size = original_size
@@ -5,17 +5,102 @@ Handles image resizing, compression, and conversion for academic applications.
 Perfect for passport photos, diagrams, and document submissions with size limits.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
 from PIL import Image
 import fitz  # PyMuPDF
 import io
+import math
+import os
+import shutil
+import subprocess
 
 from pdf_wizard.utils import (
     success, error, warning, info,
     create_progress_bar, get_file_size, format_file_size
 )
 
+# Lowest JPEG quality the size search may use
+MIN_JPEG_QUALITY = 5
+
+# Downscale attempts when even the lowest quality misses the byte budget
+MAX_DOWNSCALE_STEPS = 3
+
+
+@lru_cache(maxsize=None)
+def _find_mozjpeg() -> Optional[str]:
+    """Locate a mozjpeg cjpeg binary (optional - denser JPEGs than libjpeg at equal quality)"""
+    cjpeg = shutil.which('cjpeg')
+    if not cjpeg:
+        return None
+    try:
+        result = subprocess.run([cjpeg, '-version'], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    # Plain libjpeg also ships a cjpeg; only mozjpeg is worth the extra process
+    return cjpeg if 'mozjpeg' in (result.stdout + result.stderr).lower() else None
+
+
+def _encode_jpeg(img: Image.Image, quality: int) -> io.BytesIO:
+    """
+    Encode an RGB/L image to an in-memory JPEG
+    
+    Uses mozjpeg's cjpeg when installed, otherwise Pillow. Output is always
+    progressive with optimized Huffman tables.
+    
+    Args:
+        img: Decoded RGB or L image
+        quality: JPEG quality (1-95)
+    
+    Returns:
+        Buffer holding the JPEG, positioned at its end so tell() is the size
+    """
+    buffer = io.BytesIO()
+    # 4:2:0 chroma subsampling is invisible at normal qualities and saves 10-20%;
+    # keep full chroma when a high quality was asked for
+    full_chroma = quality >= 90
+    cjpeg = _find_mozjpeg()
+    if cjpeg:
+        raw = io.BytesIO()
+        img.save(raw, format='PPM')
+        result = subprocess.run(
+            [cjpeg, '-quality', str(quality), '-optimize', '-progressive',
+             '-sample', '1x1' if full_chroma else '2x2'],
+            input=raw.getbuffer(), capture_output=True
+        )
+        if result.returncode == 0:
+            buffer.write(result.stdout)
+            return buffer
+    img.save(
+        buffer, format='JPEG', quality=quality, optimize=True, progressive=True,
+        subsampling=0 if full_chroma else 2
+    )
+    return buffer
+
+
+def _open_output(path: Path):
+    """
+    Open an output file for a single sequential write
+    
+    Passes O_SEQUENTIAL where the OS has it (Windows) so the cache manager
+    reads ahead/evicts for streaming instead of keeping the file hot.
+    
+    Args:
+        path: File to create or truncate
+    
+    Returns:
+        Binary file object with a 1 MiB buffer
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    flags |= getattr(os, 'O_SEQUENTIAL', 0) | getattr(os, 'O_BINARY', 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        return os.fdopen(fd, 'wb', buffering=1024 * 1024)
+    except Exception:
+        os.close(fd)
+        raise
+
 
 def resize_image(
     input_file: Path,
@@ -23,7 +108,10 @@ def resize_image(
     target_size_kb: Optional[int] = None,
     dimensions: Optional[Tuple[int, int]] = None,
     output_format: str = 'JPEG',
-    max_iterations: int = 10
+    max_iterations: int = 10,
+    max_quality: int = 95,
+    size_tolerance: float = 0.02,
+    on_progress: Optional[Callable[[float], None]] = None
 ) -> Tuple[bool, Optional[str]]:
     """
     Resize and compress image to meet size and/or dimension requirements
@@ -36,6 +124,9 @@ def resize_image(
         dimensions: Target dimensions (width, height) in pixels
         output_format: Output format ('JPEG', 'PNG')
         max_iterations: Maximum attempts to hit target size
+        max_quality: Highest JPEG quality the search may use
+        size_tolerance: Stop searching once within this fraction below the target
+        on_progress: Called with the completed fraction (0.0-1.0) after each quality probe
     
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
@@ -44,8 +135,17 @@ def resize_image(
         original_size = get_file_size(input_file)
         info(f"Processing {input_file.name} ({format_file_size(original_size)})...")
         
-        # Open image
+        # Already under target with nothing to resize or convert - keep the original bytes
+        if (target_size_kb and not dimensions and original_size <= target_size_kb * 1024
+                and input_file.suffix.lower() == output_file.suffix.lower()):
+            if input_file.resolve() != output_file.resolve():
+                shutil.copyfile(input_file, output_file)
+            success(f"Image already under {target_size_kb} KB ({format_file_size(original_size)}), copied unchanged")
+            return True, None
+        
+        # Open and decode once - every quality probe below reuses the in-memory pixels
         img = Image.open(input_file)
+        img.load()
         original_dimensions = img.size
         
         # Handle transparency for JPEG
@@ -73,38 +173,59 @@ def resize_image(
             # For PNG, we just maximize compression
             if output_format.upper() == 'PNG':
                 # PNG is lossless, so quality param doesn't apply the same way
-                img.save(output_file, format='PNG', optimize=True, compress_level=9)
+                with _open_output(output_file) as f:
+                    img.save(f, format='PNG', optimize=True, compress_level=9)
                 final_size = get_file_size(output_file)
                 if final_size > target_bytes:
                     # If still too big, warn user. Converting to JPEG is the only real way to get small sizes
                     warning(f"PNG compression limit reached ({format_file_size(final_size)}). Try JPEG for smaller sizes.")
             else:
-                # JPEG Binary search for optimal quality
-                # We start much lower to guarantee hitting the target
-                quality_low, quality_high = 5, 95
-                best_quality = 5  # Default to low if we fail
+                # Resolution is only given up as a fallback: when even the lowest
+                # quality at full size misses the budget. JPEG size tracks pixel
+                # count, so shrink by the square root of the overshoot (plus a margin)
+                if not dimensions and original_size > target_bytes:
+                    for _ in range(MAX_DOWNSCALE_STEPS):
+                        lowest_size = _encode_jpeg(img, MIN_JPEG_QUALITY).tell()
+                        if lowest_size <= target_bytes or min(img.size) <= 1:
+                            break
+                        scale = 0.95 * math.sqrt(target_bytes / lowest_size)
+                        new_size = (max(1, int(img.width * scale)), max(1, int(img.height * scale)))
+                        warning(f"Downscaling from {img.width}x{img.height} to {new_size[0]}x{new_size[1]} "
+                                f"- the target can't be met at full resolution")
+                        # reducing_gap does a fast integer box reduce before the LANCZOS pass
+                        img = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
                 
-                found_solution = False
+                # JPEG Binary search for optimal quality
+                # We start much lower to guarantee hitting the target.
+                # Probes are encoded in memory by _encode_jpeg.
+                quality_low, quality_high = MIN_JPEG_QUALITY, max_quality
+                best_buffer = None  # Smallest encode that fits, kept to avoid a final re-encode
+                # Bisection needs about log2(range) probes, plus the first one at max quality
+                expected_probes = 1 + min(max_iterations, math.ceil(math.log2(max(2, quality_high - quality_low))))
                 
-                # First check if 95 works (high quality)
-                buffer = io.BytesIO()
-                img.save(buffer, format='JPEG', quality=95, optimize=True)
+                # First check if max quality works (high quality)
+                buffer = _encode_jpeg(img, quality_high)
+                if on_progress:
+                    on_progress(1 / expected_probes)
                 if buffer.tell() <= target_bytes:
-                    best_quality = 95
-                    found_solution = True
+                    best_buffer = buffer
                 else:
+                    quality_high -= 1
                     # Search
                     for attempt in range(max_iterations):
                         quality = (quality_low + quality_high) // 2
                         
-                        buffer = io.BytesIO()
-                        img.save(buffer, format='JPEG', quality=quality, optimize=True)
+                        buffer = _encode_jpeg(img, quality)
                         current_size = buffer.tell()
+                        if on_progress:
+                            on_progress(min(1.0, (attempt + 2) / expected_probes))
                         
                         if current_size <= target_bytes:
-                            best_quality = quality # valid, try higher
+                            best_buffer = buffer  # valid, try higher
                             quality_low = quality + 1
-                            found_solution = True
+                            # Within tolerance of the target - more probes won't gain much
+                            if current_size >= target_bytes * (1 - size_tolerance):
+                                break
                         else:
                             quality_high = quality - 1
                         
@@ -112,28 +233,30 @@ def resize_image(
                             break
                 
                 # Save with best found
-                if not found_solution:
+                if best_buffer is None:
                     # Even lowest quality was too big? Resize it down?
                     # For now just save at lowest quality
-                    best_quality = 5
                     warning("Could not meet target size even at lowest quality.")
+                    best_buffer = _encode_jpeg(img, MIN_JPEG_QUALITY)
 
-                with open(output_file, 'wb') as f:
-                    img.save(f, format='JPEG', quality=best_quality, optimize=True)
+                with _open_output(output_file) as f:
+                    f.write(best_buffer.getbuffer())
+                if on_progress:
+                    on_progress(1.0)
                 
             final_size = get_file_size(output_file)
             success(f"Image processed: {format_file_size(original_size)} → {format_file_size(final_size)}")
             
         else:
             # Just save with high quality
-            img.save(output_file, format=output_format, quality=90, optimize=True)
+            with _open_output(output_file) as f:
+                img.save(f, format=output_format, quality=90, optimize=True)
             final_size = get_file_size(output_file)
             success(f"Image saved: {format_file_size(original_size)} → {format_file_size(final_size)}")
         
         # Show dimensions if changed
         if dimensions:
-            final_img = Image.open(output_file)
-            info(f"Final dimensions: {final_img.width}x{final_img.height}")
+            info(f"Final dimensions: {img.width}x{img.height}")
         
         return True, None
         
@@ -147,7 +270,9 @@ def compress_image(
     input_file: Path,
     output_file: Path,
     target_size_kb: int,
-    preserve_transparency: bool = False
+    preserve_transparency: bool = False,
+    max_quality: int = 95,
+    on_progress: Optional[Callable[[float], None]] = None
 ) -> Tuple[bool, Optional[str]]:
     """
     Compress image to target file size
@@ -157,16 +282,21 @@ def compress_image(
         output_file: Output compressed image
         target_size_kb: Target size in KB
         preserve_transparency: Keep transparency (forces PNG format)
+        max_quality: Highest JPEG quality to try
+        on_progress: Optional callback receiving the completed fraction
     
     Returns:
         Tuple of (success: bool, error_message: Optional[str])
     """
     output_format = 'PNG' if preserve_transparency else 'JPEG'
-    return resize_image(input_file, output_file, target_size_kb=target_size_kb, output_format=output_format)
+    return resize_image(
+        input_file, output_file, target_size_kb=target_size_kb,
+        output_format=output_format, max_quality=max_quality,
+        on_progress=on_progress
+    )
 
 
 import concurrent.futures
-import os
 
 # ... (previous imports)
 
@@ -242,12 +372,26 @@ def batch_image_resize(
         return False, error_msg
 
 
+def _prepare_image_for_pdf(img_path: Path) -> Tuple[bytes, int, int]:
+    """Load one image as JPEG bytes for embedding in a PDF (runs in a worker thread)"""
+    with Image.open(img_path) as img:
+        if img.format == 'JPEG' and img.mode in ('RGB', 'L'):
+            # PDF viewers decode JPEG natively - embed the original bytes, no re-encode
+            return img_path.read_bytes(), img.width, img.height
+        
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        buffer = io.BytesIO()
+        img.save(buffer, format='JPEG', quality=90)
+        return buffer.getvalue(), img.width, img.height
+
+
 def image_to_pdf(
     image_files: List[Path],
     output_pdf: Path
 ) -> Tuple[bool, Optional[str]]:
     """
-    Convert one or more images to a PDF
+    Convert one or more images to a PDF, preparing the images in a thread pool
     
     Args:
         image_files: List of image file paths
@@ -259,31 +403,23 @@ def image_to_pdf(
     try:
         info(f"Converting {len(image_files)} images to PDF...")
         
-        # Open first image to get document started
-        first_img = Image.open(image_files[0])
-        
-        # Convert all images to RGB
-        images = []
-        for img_path in image_files:
-            img = Image.open(img_path)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            images.append(img)
-        
-        # Save as PDF
-        first_img = images[0]
-        other_images = images[1:] if len(images) > 1 else None
-        
-        if other_images:
-            first_img.save(
-                output_pdf,
-                save_all=True,
-                append_images=other_images,
-                resolution=100.0,
-                quality=90
-            )
+        # Decode/encode images across CPU cores; a single image isn't worth a pool.
+        # Threads suffice - Pillow drops the GIL while decoding, converting and
+        # encoding - and spare each worker an interpreter start plus pickling its
+        # JPEG bytes back. map keeps page order.
+        if len(image_files) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(image_files), os.cpu_count() or 4)) as executor:
+                prepared = list(executor.map(_prepare_image_for_pdf, image_files))
         else:
-            first_img.save(output_pdf, resolution=100.0, quality=90)
+            prepared = [_prepare_image_for_pdf(image_files[0])]
+        
+        # Stitch pages in order at 100 DPI
+        doc = fitz.open()
+        for data, width, height in prepared:
+            page = doc.new_page(width=width * 72 / 100, height=height * 72 / 100)
+            page.insert_image(page.rect, stream=data)
+        doc.save(str(output_pdf), garbage=4, deflate=True, clean=True)
+        doc.close()
         
         file_size = format_file_size(get_file_size(output_pdf))
         success(f"Created PDF with {len(image_files)} images → {output_pdf.name} ({file_size})")
@@ -301,24 +437,31 @@ def _process_pdf_page_chunk(args):
     input_pdf_path, output_dir, output_format, dpi, page_indices = args
     
     doc = fitz.open(str(input_pdf_path))
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
     processed_count = 0
+    pix = page = None
+    
+    try:
+        for page_num in page_indices:
+            page = doc[page_num]
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+            
+            output_path = output_dir / f"{Path(input_pdf_path).stem}_page_{page_num + 1}.{output_format.lower()}"
+            
+            # MuPDF encodes PNG/JPEG straight from its own buffer - no PIL copy of the page
+            if output_format.upper() == 'PNG':
+                pix.save(output_path)
+            else:
+                pix.save(output_path, output='jpeg', jpg_quality=90)
+            
+            # Free this page's bitmap before rendering the next - at high DPI each is hundreds of MB
+            pix = None
+            processed_count += 1
+    finally:
+        # Drop page/pixmap references before closing so a failed save doesn't pin them
+        pix = page = None
+        doc.close()
     
-    for page_num in page_indices:
-        page = doc[page_num]
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        pix = page.get_pixmap(matrix=mat)
-        
-        output_path = output_dir / f"{Path(input_pdf_path).stem}_page_{page_num + 1}.{output_format.lower()}"
-        
-        if output_format.upper() == 'PNG':
-            pix.save(output_path)
-        else:
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img.save(output_path, format=output_format, quality=90)
-        
-        processed_count += 1
-        
-    doc.close()
     return processed_count
 
 def pdf_to_images(
@@ -339,9 +482,10 @@ def pdf_to_images(
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Determine chunk size for workers
-        num_cores = os.cpu_count() or 4
-        chunk_size = max(1, page_count // num_cores)
+        # One chunk per worker, sized up so there's no short leftover chunk
+        # running alone at the end; never start more workers than pages
+        num_workers = max(1, min(os.cpu_count() or 4, page_count))
+        chunk_size = max(1, -(-page_count // num_workers))
         
         # Create chunks of page indices
         chunks = []
@@ -352,15 +496,20 @@ def pdf_to_images(
             
         progress = create_progress_bar(page_count, "Extracting pages (Parallel)")
         
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            # We use submit here to update progress bar as chunks complete
-            futures = [executor.submit(_process_pdf_page_chunk, chunk) for chunk in chunks]
-            
-            completed_pages = 0
-            for future in concurrent.futures.as_completed(futures):
-                count = future.result()
-                completed_pages += count
-                progress.update(count)
+        if len(chunks) <= 1:
+            # Single page or single core - spawning a worker would only add start-up time
+            for chunk in chunks:
+                progress.update(_process_pdf_page_chunk(chunk))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+                # We use submit here to update progress bar as chunks complete
+                futures = [executor.submit(_process_pdf_page_chunk, chunk) for chunk in chunks]
+                
+                completed_pages = 0
+                for future in concurrent.futures.as_completed(futures):
+                    count = future.result()
+                    completed_pages += count
+                    progress.update(count)
                 
         progress.close()
         
@@ -371,3 +520,23 @@ def pdf_to_images(
         error_msg = f"Error extracting images from PDF: {str(e)}"
         error(error_msg)
         return False, error_msg
+
+
+def render_page_preview(input_pdf: Path, page_number: int = 0, scale: float = 0.25) -> Image.Image:
+    """
+    Render one PDF page as a small RGB thumbnail
+    
+    Args:
+        input_pdf: Path to the PDF file
+        page_number: Zero-based page to render
+        scale: Zoom relative to 72 DPI (0.25 gives a ~150px wide A4 page)
+    
+    Returns:
+        PIL Image of the page
+    """
+    with fitz.open(str(input_pdf)) as doc:
+        pix = doc[page_number].get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+        # frombytes copies the samples, so the pixmap can go before the document closes
+        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        pix = None
+    return img
@@ -7,7 +7,8 @@ Includes encryption checking and progress bar support.
 
 from pathlib import Path
 from typing import List, Optional, Tuple
-from PyPDF2 import PdfReader, PdfWriter, PdfMerger
+from PyPDF2 import PdfReader, PdfWriter
+import fitz  # PyMuPDF
 import click
 
 from pdf_wizard.utils import (
@@ -51,34 +52,39 @@ def merge_pdfs(
         Tuple of (success: bool, error_message: Optional[str])
     """
     try:
-        # Check for encrypted files first
-        encrypted_files = []
-        for pdf_file in input_files:
-            if check_encryption(pdf_file):
-                encrypted_files.append(pdf_file.name)
-        
-        if encrypted_files:
-            error_msg = f"Cannot merge encrypted PDFs: {', '.join(encrypted_files)}"
-            error(error_msg)
-            return False, error_msg
-        
         info(f"Merging {len(input_files)} PDF files...")
         
-        # Use PdfMerger for efficient merging
-        merger = PdfMerger()
+        # PyMuPDF copies pages in C without rebuilding each file's object graph in Python
+        merged = fitz.open()
+        merged_toc = []  # Every input's outline, re-pointed at its pages in the merged file
+        encrypted_files = []
         
         if show_progress:
             progress = create_progress_bar(len(input_files), "Merging PDFs")
         
         for pdf_file in input_files:
             try:
-                merger.append(str(pdf_file))
+                with fitz.open(str(pdf_file)) as src:
+                    # needs_pass misses owner-password-only files (empty user password),
+                    # which MuPDF opens transparently; the encryption entry catches both
+                    if src.needs_pass or src.metadata.get('encryption'):
+                        encrypted_files.append(pdf_file.name)
+                    elif not encrypted_files:
+                        # insert_pdf doesn't carry bookmarks over - shift them past the pages so far
+                        offset = len(merged)
+                        for level, title, page, dest in src.get_toc(simple=False):
+                            if page > 0:  # -1/0 mean "no target page"
+                                page += offset
+                                dest = dict(dest, page=page - 1)
+                            merged_toc.append([level, title, page, dest])
+                        merged.insert_pdf(src)
                 if show_progress:
                     progress.update(1)
                     progress.set_postfix_str(f"Added: {pdf_file.name}")
             except Exception as e:
                 if show_progress:
                     progress.close()
+                merged.close()
                 error_msg = f"Error adding {pdf_file.name}: {str(e)}"
                 error(error_msg)
                 return False, error_msg
@@ -86,10 +92,26 @@ def merge_pdfs(
         if show_progress:
             progress.close()
         
+        if encrypted_files:
+            merged.close()
+            error_msg = f"Cannot merge encrypted PDFs: {', '.join(encrypted_files)}"
+            error(error_msg)
+            return False, error_msg
+        
+        if merged_toc:
+            merged.set_toc(merged_toc)
+        
         # Write merged PDF
         info(f"Writing merged PDF to {output_file.name}...")
-        merger.write(str(output_file))
-        merger.close()
+        merged.save(
+            str(output_file),
+            garbage=4,  # Drop objects orphaned by the page copies
+            deflate=True,
+            deflate_images=True,
+            deflate_fonts=True,
+            clean=True,
+        )
+        merged.close()
         
         # Report success with file size
         file_size = format_file_size(get_file_size(output_file))
@@ -117,7 +139,7 @@ def split_pdf(
         input_file: PDF file to split
         output_dir: Directory to save split PDFs
         mode: 'pages' (one file per page) or 'ranges' (custom page ranges)
-        page_ranges: List of page range strings like ['1-5', '6-10'] for ranges mode
+        page_ranges: List of page range strings like ['1-5', '6-end'] for ranges mode
         show_progress: Whether to show progress bar
     
     Returns:
@@ -177,9 +199,11 @@ def split_pdf(
             
             for idx, range_str in enumerate(page_ranges):
                 try:
-                    # Parse range like "1-5" or "10"
+                    # Parse range like "1-5", "9-end" or "10"
                     if '-' in range_str:
-                        start, end = map(int, range_str.split('-'))
+                        start_str, end_str = range_str.split('-')
+                        start = int(start_str)
+                        end = total_pages if end_str.strip().lower() == 'end' else int(end_str)
                     else:
                         start = end = int(range_str)
                     
@@ -203,7 +227,7 @@ def split_pdf(
                 except ValueError:
                     if show_progress:
                         progress.close()
-                    error_msg = f"Invalid range format: {range_str}. Use format like '1-5' or '10'"
+                    error_msg = f"Invalid range format: {range_str}. Use format like '1-5', '6-end' or '10'"
                     error(error_msg)
                     return False, error_msg
             
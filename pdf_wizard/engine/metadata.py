@@ -4,16 +4,54 @@ PDF Metadata Module
 Handles viewing and stripping metadata from PDFs for privacy.
 """
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Tuple, Dict, List
+from typing import Iterator, Optional, Tuple, Dict, List
 from PyPDF2 import PdfReader, PdfWriter
 from datetime import datetime
+import threading
 
 from pdf_wizard.utils import (
     success, error, warning, info,
     get_file_size, format_file_size
 )
 
+# Recently parsed PDFs keyed by (path, mtime, size), so a file edited on disk is
+# re-read. Lets view -> strip on the same file parse it only once. Each reader
+# has its own lock: PdfReader reads objects lazily through one shared stream.
+_READER_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[PdfReader, threading.Lock]]" = OrderedDict()
+_READER_CACHE_SIZE = 4
+_reader_lock = threading.Lock()
+
+
+@contextmanager
+def _open_reader(pdf_path: Path) -> Iterator[PdfReader]:
+    """Hold a PdfReader for pdf_path, reusing the cached one if the file hasn't changed
+    
+    The reader is locked for the duration of the with block, so two threads
+    never read through the same stream at once.
+    """
+    st = pdf_path.stat()
+    key = (str(pdf_path.resolve()), st.st_mtime_ns, st.st_size)
+    
+    with _reader_lock:
+        entry = _READER_CACHE.get(key)
+        if entry is not None:
+            _READER_CACHE.move_to_end(key)
+    
+    if entry is None:
+        entry = (PdfReader(str(pdf_path)), threading.Lock())
+        with _reader_lock:
+            # Another thread may have cached this file meanwhile - share its reader
+            entry = _READER_CACHE.setdefault(key, entry)
+            while len(_READER_CACHE) > _READER_CACHE_SIZE:
+                _READER_CACHE.popitem(last=False)
+    
+    reader, lock = entry
+    with lock:
+        yield reader
+
 
 def view_metadata(pdf_path: Path) -> Dict[str, str]:
     """
@@ -26,20 +64,20 @@ def view_metadata(pdf_path: Path) -> Dict[str, str]:
         Dictionary of metadata fields
     """
     try:
-        reader = PdfReader(str(pdf_path))
-        
         metadata = {}
         
-        if reader.metadata:
-            for key, value in reader.metadata.items():
-                # Clean up key (remove leading slash)
-                clean_key = key.lstrip('/')
-                metadata[clean_key] = str(value) if value else "N/A"
+        with _open_reader(pdf_path) as reader:
         
-        # Add file info
-        metadata['PageCount'] = str(len(reader.pages))
-        metadata['FileSize'] = format_file_size(get_file_size(pdf_path))
-        metadata['IsEncrypted'] = str(reader.is_encrypted)
+            if reader.metadata:
+                for key, value in reader.metadata.items():
+                    # Clean up key (remove leading slash)
+                    clean_key = key.lstrip('/')
+                    metadata[clean_key] = str(value) if value else "N/A"
+        
+            # Add file info
+            metadata['PageCount'] = str(len(reader.pages))
+            metadata['FileSize'] = format_file_size(get_file_size(pdf_path))
+            metadata['IsEncrypted'] = str(reader.is_encrypted)
         
         return metadata
         
@@ -104,45 +142,45 @@ def strip_metadata(
     try:
         info(f"Stripping metadata from {input_file.name}...")
         
-        reader = PdfReader(str(input_file))
-        writer = PdfWriter()
-        
-        # Copy all pages
-        for page in reader.pages:
-            writer.add_page(page)
-        
-        if fields == 'all':
-            # Don't copy any metadata - creates a clean PDF
-            info("Removing all metadata fields")
-        elif fields == 'selective' and fields_to_strip:
-            # Copy metadata but exclude specified fields
-            if reader.metadata:
-                new_metadata = {}
-                for key, value in reader.metadata.items():
-                    clean_key = key.lstrip('/')
-                    if clean_key not in fields_to_strip:
-                        new_metadata[key] = value
+        with _open_reader(input_file) as reader:
+            writer = PdfWriter()
+        
+            # Copy all pages
+            for page in reader.pages:
+                writer.add_page(page)
+        
+            if fields == 'all':
+                # Don't copy any metadata - creates a clean PDF
+                info("Removing all metadata fields")
+            elif fields == 'selective' and fields_to_strip:
+                # Copy metadata but exclude specified fields
+                if reader.metadata:
+                    new_metadata = {}
+                    for key, value in reader.metadata.items():
+                        clean_key = key.lstrip('/')
+                        if clean_key not in fields_to_strip:
+                            new_metadata[key] = value
                 
-                if new_metadata:
-                    writer.add_metadata(new_metadata)
-                    info(f"Removed {len(fields_to_strip)} metadata fields")
-        else:
-            # Invalid options
-            error_msg = "Invalid fields option. Use 'all' or specify fields_to_strip for 'selective'"
-            error(error_msg)
-            return False, error_msg
-        
-        # Write output
-        with open(output_file, 'wb') as f:
-            writer.write(f)
-        
-        file_size = format_file_size(get_file_size(output_file))
-        success(f"Metadata stripped → {output_file.name} ({file_size})")
-        
-        # Show what was removed
-        if fields == 'all' and reader.metadata:
-            removed_fields = [key.lstrip('/') for key in reader.metadata.keys()]
-            info(f"Removed fields: {', '.join(removed_fields)}")
+                    if new_metadata:
+                        writer.add_metadata(new_metadata)
+                        info(f"Removed {len(fields_to_strip)} metadata fields")
+            else:
+                # Invalid options
+                error_msg = "Invalid fields option. Use 'all' or specify fields_to_strip for 'selective'"
+                error(error_msg)
+                return False, error_msg
+        
+            # Write output
+            with open(output_file, 'wb') as f:
+                writer.write(f)
+        
+            file_size = format_file_size(get_file_size(output_file))
+            success(f"Metadata stripped → {output_file.name} ({file_size})")
+        
+            # Show what was removed
+            if fields == 'all' and reader.metadata:
+                removed_fields = [key.lstrip('/') for key in reader.metadata.keys()]
+                info(f"Removed fields: {', '.join(removed_fields)}")
         
         return True, None
         
@@ -171,23 +209,23 @@ def add_metadata(
     try:
         info(f"Adding metadata to {input_file.name}...")
         
-        reader = PdfReader(str(input_file))
-        writer = PdfWriter()
+        with _open_reader(input_file) as reader:
+            writer = PdfWriter()
         
-        # Copy all pages
-        for page in reader.pages:
-            writer.add_page(page)
+            # Copy all pages
+            for page in reader.pages:
+                writer.add_page(page)
         
-        # Start with existing metadata
-        if reader.metadata:
-            writer.add_metadata(reader.metadata)
+            # Start with existing metadata
+            if reader.metadata:
+                writer.add_metadata(reader.metadata)
         
-        # Add/update new metadata
-        writer.add_metadata(metadata)
+            # Add/update new metadata
+            writer.add_metadata(metadata)
         
-        # Write output
-        with open(output_file, 'wb') as f:
-            writer.write(f)
+            # Write output
+            with open(output_file, 'wb') as f:
+                writer.write(f)
         
         success(f"Metadata updated → {output_file.name}")
         info(f"Updated fields: {', '.join(metadata.keys())}")
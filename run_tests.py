@@ -30,8 +30,12 @@ class TestRunner:
     def log(self, message, color=Colors.BLUE):
         print(f"{color}{message}{Colors.END}")
     
-    def run_command(self, cmd, test_name):
-        """Run a command and capture results"""
+    def run_command(self, cmd, test_name, check=None):
+        """Run a command and capture results
+        
+        check: optional callable run after a zero exit; the test fails if it
+        returns False (for commands that report errors without an exit code)
+        """
         print(f"\n{'='*70}")
         self.log(f"TEST: {test_name}", Colors.BLUE)
         print(f"Command: {' '.join(cmd)}")
@@ -45,7 +49,7 @@ class TestRunner:
                 timeout=30
             )
             
-            if result.returncode == 0:
+            if result.returncode == 0 and (check is None or check()):
                 self.log(f"✓ PASSED: {test_name}", Colors.GREEN)
                 self.passed += 1
                 self.results.append((test_name, "PASS", ""))
@@ -71,6 +75,16 @@ class TestRunner:
             self.results.append((test_name, "ERROR", str(e)))
             return False
     
+    @staticmethod
+    def _toc_pages(pdf_path):
+        """Target page of each outline entry, or None if the file can't be read"""
+        import fitz
+        try:
+            with fitz.open(str(pdf_path)) as doc:
+                return [entry[2] for entry in doc.get_toc()]
+        except Exception:
+            return None
+    
     def create_minimal_samples(self):
         """Create minimal test samples using PyMuPDF"""
         self.log("\n📦 Creating minimal test samples...", Colors.YELLOW)
@@ -83,6 +97,7 @@ class TestRunner:
         doc = fitz.open()
         page = doc.new_page()
         page.insert_text((100, 100), "Test PDF 1", fontsize=12)
+        doc.set_toc([[1, "Test PDF 1", 1]])
         doc.save(str(self.test_dir / "test1.pdf"))
         doc.close()
         
@@ -90,6 +105,7 @@ class TestRunner:
         doc = fitz.open()
         page = doc.new_page()
         page.insert_text((100, 100), "Test PDF 2", fontsize=12)
+        doc.set_toc([[1, "Test PDF 2", 1]])
         doc.save(str(self.test_dir / "test2.pdf"))
         doc.close()
         
@@ -101,6 +117,14 @@ class TestRunner:
         doc.save(str(self.test_dir / "multi_page.pdf"))
         doc.close()
         
+        # Owner-password-only PDF (opens without a password, but restricted)
+        from PyPDF2 import PdfReader, PdfWriter
+        writer = PdfWriter()
+        writer.append_pages_from_reader(PdfReader(str(self.test_dir / "test1.pdf")))
+        writer.encrypt(user_password="", owner_password="owner123")
+        with open(self.test_dir / "owner_protected.pdf", "wb") as f:
+            writer.write(f)
+        
         # Test image
         img = Image.new('RGB', (800, 800), color=(200, 150, 150))
         draw = ImageDraw.Draw(img)
@@ -121,7 +145,18 @@ class TestRunner:
             str(self.test_dir / "test1.pdf"),
             str(self.test_dir / "test2.pdf"),
             "-o", str(self.output_dir / "merged.pdf")
-        ], "1. Merge - Combine 2 PDFs")
+        ], "1. Merge - Combine 2 PDFs (keeps bookmarks)", check=lambda: self._toc_pages(self.output_dir / "merged.pdf") == [1, 2])
+        
+        # 1b. Merge must refuse encrypted inputs, even with an empty user password
+        rejected_output = self.output_dir / "merged_owner_protected.pdf"
+        if rejected_output.exists():
+            rejected_output.unlink()
+        self.run_command([
+            "pdf-wizard", "merge",
+            str(self.test_dir / "test1.pdf"),
+            str(self.test_dir / "owner_protected.pdf"),
+            "-o", str(rejected_output)
+        ], "1b. Merge - Reject owner-password-only PDF", check=lambda: not rejected_output.exists())
         
         # 2. Split
         self.run_command([
@@ -130,6 +165,15 @@ class TestRunner:
             "-o", str(self.output_dir / "split_output")
         ], "2. Split - One file per page")
         
+        # 2b. Split by ranges, with 'end' standing for the last page
+        self.run_command([
+            "pdf-wizard", "split",
+            str(self.test_dir / "multi_page.pdf"),
+            "-o", str(self.output_dir / "split_ranges"),
+            "--mode", "ranges", "--ranges", "1-2,3-end"
+        ], "2b. Split - Ranges up to 'end'",
+            check=lambda: (self.output_dir / "split_ranges" / "multi_page_range_2_3-end.pdf").exists())
+        
         # 3. Compress
         self.run_command([
             "pdf-wizard", "compress",
@@ -29,11 +29,15 @@ setup(
     ],
     extras_require={
         'ocr': ['pytesseract>=0.3.10'],
+        'gui': ['customtkinter>=5.2.0', 'tkinterdnd2>=0.3.0'],
     },
     entry_points={
         'console_scripts': [
             'pdf-wizard=pdf_wizard.cli:cli',
         ],
+        'gui_scripts': [
+            'pdf-wizard-gui=gui.app:main',
+        ],
     },
     classifiers=[
         "Development Status :: 4 - Beta",